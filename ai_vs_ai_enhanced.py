@@ -7,6 +7,7 @@ import pygame
 import sys
 import time
 import random
+import argparse
 import numpy as np
 import skfuzzy as fuzz
 from skfuzzy import control as ctrl
@@ -16,6 +17,9 @@ from ui_config_enhanced import (Colors, Dimensions, fonts, draw_gradient_rect,
                                  draw_radial_gradient, draw_animated_border,
                                  LayoutCalculator)
 from animations_enhanced import AnimationManager
+from profiler_enhanced import profiler
+from mancala_core import (DIFFICULTY_LEVELS, DEFAULT_DIFFICULTY, difficulty_budget, search_with_budget,
+                          select_root_move)
 
 pygame.init()
 
@@ -110,7 +114,10 @@ def draw_animated_background(surface, phase):
 def draw_board(mancala, animation_manager, highlight_pit=None, ai1_prob=0,
                ai2_prob=0, turn_message="", move_count=0, phase=0):
     """Draw the ultra-modern game board"""
-    draw_animated_background(screen, phase)
+    profiler.poll_toggle()
+
+    with profiler.scope("background"):
+        draw_animated_background(screen, phase)
 
     board_rect = LayoutCalculator.get_board_rect(Dimensions.SCREEN_WIDTH, Dimensions.SCREEN_HEIGHT)
     pit_positions = LayoutCalculator.get_pit_positions(board_rect)
@@ -118,155 +125,170 @@ def draw_board(mancala, animation_manager, highlight_pit=None, ai1_prob=0,
 
     shake_offset = animation_manager.get_shake_offset()
 
-    # Board with glow
-    glow_rect = board_rect.inflate(Dimensions.BOARD_GLOW_RADIUS * 2,
-                                   Dimensions.BOARD_GLOW_RADIUS * 2)
-    draw_neon_glow(screen, glow_rect.center, board_rect.width // 2, Colors.BOARD_GLOW, 0.3)
-
-    # Board background
-    board_surf = pygame.Surface((board_rect.width, board_rect.height), pygame.SRCALPHA)
-    draw_triple_gradient_rect(board_surf, Colors.BOARD_PRIMARY, Colors.BOARD_SECONDARY,
-                              Colors.BOARD_PRIMARY,
-                              pygame.Rect(0, 0, board_rect.width, board_rect.height),
-                              vertical=False, border_radius=Dimensions.BOARD_BORDER_RADIUS)
-    board_surf.set_alpha(220)
-    screen.blit(board_surf, (board_rect.x + shake_offset[0], board_rect.y + shake_offset[1]))
-
-    # Animated border
-    draw_animated_border(screen, board_rect.move(shake_offset[0], shake_offset[1]),
-                        Colors.BOARD_BORDER, phase, width=4,
-                        border_radius=Dimensions.BOARD_BORDER_RADIUS)
+    with profiler.scope("board"):
+        # Board with glow
+        glow_rect = board_rect.inflate(Dimensions.BOARD_GLOW_RADIUS * 2,
+                                       Dimensions.BOARD_GLOW_RADIUS * 2)
+        draw_neon_glow(screen, glow_rect.center, board_rect.width // 2, Colors.BOARD_GLOW, 0.3)
+
+        # Board background
+        board_surf = pygame.Surface((board_rect.width, board_rect.height), pygame.SRCALPHA)
+        draw_triple_gradient_rect(board_surf, Colors.BOARD_PRIMARY, Colors.BOARD_SECONDARY,
+                                  Colors.BOARD_PRIMARY,
+                                  pygame.Rect(0, 0, board_rect.width, board_rect.height),
+                                  vertical=False, border_radius=Dimensions.BOARD_BORDER_RADIUS)
+        board_surf.set_alpha(220)
+        screen.blit(board_surf, (board_rect.x + shake_offset[0], board_rect.y + shake_offset[1]))
+
+        # Animated border
+        draw_animated_border(screen, board_rect.move(shake_offset[0], shake_offset[1]),
+                            Colors.BOARD_BORDER, phase, width=4,
+                            border_radius=Dimensions.BOARD_BORDER_RADIUS)
 
     # Draw mancala stores
-    for store_id, store_rect in mancala_positions.items():
-        is_ai1 = store_id == 6
-        color1 = Colors.PLAYER1_PRIMARY if is_ai1 else Colors.PLAYER2_PRIMARY
-        color2 = Colors.PLAYER1_SECONDARY if is_ai1 else Colors.PLAYER2_SECONDARY
-
-        draw_neon_glow(screen,
-                      (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1]),
-                      store_rect.width // 2, color1, 0.4)
-
-        store_surf = pygame.Surface((store_rect.width, store_rect.height), pygame.SRCALPHA)
-        draw_gradient_rect(store_surf, color1, color2,
-                          pygame.Rect(0, 0, store_rect.width, store_rect.height),
-                          vertical=True, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
-        store_surf.set_alpha(200)
-        screen.blit(store_surf, (store_rect.x + shake_offset[0], store_rect.y + shake_offset[1]))
-
-        pygame.draw.rect(screen, color1,
-                        store_rect.move(shake_offset[0], shake_offset[1]),
-                        width=4, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
-
-        score = str(mancala[store_id])
-        text_pos = (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1])
-        draw_text_with_glow(screen, fonts.large, score, text_pos, Colors.TEXT_PRIMARY,
-                           glow_color=color1, glow_intensity=3)
+    with profiler.scope("stores"):
+        for store_id, store_rect in mancala_positions.items():
+            is_ai1 = store_id == 6
+            color1 = Colors.PLAYER1_PRIMARY if is_ai1 else Colors.PLAYER2_PRIMARY
+            color2 = Colors.PLAYER1_SECONDARY if is_ai1 else Colors.PLAYER2_SECONDARY
+
+            draw_neon_glow(screen,
+                          (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1]),
+                          store_rect.width // 2, color1, 0.4)
+
+            store_surf = pygame.Surface((store_rect.width, store_rect.height), pygame.SRCALPHA)
+            draw_gradient_rect(store_surf, color1, color2,
+                              pygame.Rect(0, 0, store_rect.width, store_rect.height),
+                              vertical=True, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
+            store_surf.set_alpha(200)
+            screen.blit(store_surf, (store_rect.x + shake_offset[0], store_rect.y + shake_offset[1]))
+
+            pygame.draw.rect(screen, color1,
+                            store_rect.move(shake_offset[0], shake_offset[1]),
+                            width=4, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
+
+            score = str(mancala[store_id])
+            text_pos = (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1])
+            draw_text_with_glow(screen, fonts.large, score, text_pos, Colors.TEXT_PRIMARY,
+                               glow_color=color1, glow_intensity=3)
 
     # Draw pits
-    for pit_id, pos in pit_positions.items():
-        is_ai1_pit = 0 <= pit_id <= 5
-        is_highlighted = highlight_pit == pit_id
+    with profiler.scope("pits"):
+        for pit_id, pos in pit_positions.items():
+            is_ai1_pit = 0 <= pit_id <= 5
+            is_highlighted = highlight_pit == pit_id
 
-        pit_pos = (pos[0] + shake_offset[0], pos[1] + shake_offset[1])
+            pit_pos = (pos[0] + shake_offset[0], pos[1] + shake_offset[1])
 
-        if is_highlighted:
-            pit_color = Colors.PIT_SELECTED
-            glow_color = Colors.NEON_YELLOW
-            glow_intensity = 1.2
-        else:
-            pit_color = Colors.PIT_ACTIVE if mancala[pit_id] > 0 else Colors.PIT_INACTIVE
-            glow_color = Colors.PLAYER1_PRIMARY if is_ai1_pit else Colors.PLAYER2_PRIMARY
-            glow_intensity = 0.4 if mancala[pit_id] > 0 else 0.1
-
-        if glow_intensity > 0.2:
-            draw_neon_glow(screen, pit_pos, Dimensions.PIT_RADIUS, glow_color, glow_intensity)
-
-        draw_radial_gradient(screen, pit_pos, pit_color, Colors.PIT_INACTIVE, Dimensions.PIT_RADIUS)
-
-        border_color = glow_color if mancala[pit_id] > 0 else Colors.PIT_BORDER_INACTIVE
-        pygame.draw.circle(screen, border_color, pit_pos, Dimensions.PIT_RADIUS, width=3)
-
-        # Inner shadow
-        shadow_surf = pygame.Surface((Dimensions.PIT_RADIUS * 3, Dimensions.PIT_RADIUS * 3), pygame.SRCALPHA)
-        for i in range(5):
-            alpha = 40 - i * 8
-            pygame.draw.circle(shadow_surf, (0, 0, 0, alpha),
-                             (Dimensions.PIT_RADIUS * 1.5, Dimensions.PIT_RADIUS * 1.5),
-                             Dimensions.PIT_RADIUS - i * 2)
-        screen.blit(shadow_surf, (pit_pos[0] - Dimensions.PIT_RADIUS * 1.5,
-                                  pit_pos[1] - Dimensions.PIT_RADIUS * 1.5))
-
-        stone_count = mancala[pit_id]
-        count_color = Colors.TEXT_PRIMARY if stone_count > 0 else Colors.TEXT_SECONDARY
-        draw_text_with_glow(screen, fonts.medium, str(stone_count), pit_pos,
-                           count_color, glow_color=glow_color if mancala[pit_id] > 0 else None,
-                           glow_intensity=2 if mancala[pit_id] > 0 else 0)
-
-    animation_manager.draw(screen)
-
-    # AI 1 Panel (bottom left) - FIXED: No overlap with board
-    ai1_panel_rect = pygame.Rect(20, Dimensions.SCREEN_HEIGHT - 160,
-                                  Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, ai1_panel_rect)
-
-    draw_neon_glow(screen, (ai1_panel_rect.x + 40, ai1_panel_rect.y + 30), 15, Colors.PLAYER1_PRIMARY, 0.8)
-    pygame.draw.circle(screen, Colors.PLAYER1_PRIMARY, (ai1_panel_rect.x + 40, ai1_panel_rect.y + 30), 15)
-
-    ai1_title = fonts.small.render("🤖 AI 1 Win Chance", True, Colors.TEXT_SECONDARY)
-    screen.blit(ai1_title, (ai1_panel_rect.x + 70, ai1_panel_rect.y + 20))
-
-    draw_text_with_glow(screen, fonts.large, f"{ai1_prob:.1f}%",
-                       (ai1_panel_rect.x + 70, ai1_panel_rect.y + 65),
-                       Colors.PLAYER1_PRIMARY, glow_color=Colors.PLAYER1_PRIMARY, glow_intensity=2)
-
-    bar_rect = pygame.Rect(ai1_panel_rect.x + 25, ai1_panel_rect.y + 105,
-                          Dimensions.PANEL_WIDTH - 50, 18)
-    from ui_config_enhanced import draw_progress_bar
-    draw_progress_bar(screen, bar_rect, ai1_prob / 100,
-                     Colors.PLAYER1_PRIMARY, Colors.PLAYER1_SECONDARY)
-
-    # AI 2 Panel (top-left corner) - FIXED: Top corner position
-    ai2_panel_rect = pygame.Rect(20, 20, Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, ai2_panel_rect)
-
-    draw_neon_glow(screen, (ai2_panel_rect.x + 40, ai2_panel_rect.y + 30), 15, Colors.PLAYER2_PRIMARY, 0.8)
-    pygame.draw.circle(screen, Colors.PLAYER2_PRIMARY, (ai2_panel_rect.x + 40, ai2_panel_rect.y + 30), 15)
-
-    ai2_title = fonts.small.render("🤖 AI 2 Win Chance", True, Colors.TEXT_SECONDARY)
-    screen.blit(ai2_title, (ai2_panel_rect.x + 70, ai2_panel_rect.y + 20))
-
-    draw_text_with_glow(screen, fonts.large, f"{ai2_prob:.1f}%",
-                       (ai2_panel_rect.x + 70, ai2_panel_rect.y + 65),
-                       Colors.PLAYER2_PRIMARY, glow_color=Colors.PLAYER2_PRIMARY, glow_intensity=2)
-
-    bar_rect = pygame.Rect(ai2_panel_rect.x + 25, ai2_panel_rect.y + 105,
-                          Dimensions.PANEL_WIDTH - 50, 18)
-    draw_progress_bar(screen, bar_rect, ai2_prob / 100,
-                     Colors.PLAYER2_PRIMARY, Colors.PLAYER2_SECONDARY)
-
-    # Move counter
-    move_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - 250, 40, 210, 80)
-    draw_glassmorphic_panel(screen, move_panel_rect)
-
-    move_text = f"Move: {move_count}"
-    draw_text_with_glow(screen, fonts.normal, move_text,
-                       (move_panel_rect.centerx, move_panel_rect.centery),
-                       Colors.TEXT_PRIMARY, glow_color=Colors.NEON_BLUE, glow_intensity=2)
-
-    # Exit hint panel (below move counter)
-    exit_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - 250, 130, 210, 50)
-    draw_glassmorphic_panel(screen, exit_panel_rect)
-
-    exit_text = "Press ESC to quit"
-    draw_text_with_glow(screen, fonts.small, exit_text,
-                       (exit_panel_rect.centerx, exit_panel_rect.centery),
-                       Colors.TEXT_SECONDARY, glow_color=Colors.NEON_PINK, glow_intensity=1)
+            if is_highlighted:
+                pit_color = Colors.PIT_SELECTED
+                glow_color = Colors.NEON_YELLOW
+                glow_intensity = 1.2
+            else:
+                pit_color = Colors.PIT_ACTIVE if mancala[pit_id] > 0 else Colors.PIT_INACTIVE
+                glow_color = Colors.PLAYER1_PRIMARY if is_ai1_pit else Colors.PLAYER2_PRIMARY
+                glow_intensity = 0.4 if mancala[pit_id] > 0 else 0.1
+
+            with profiler.scope("pits.glow"):
+                if glow_intensity > 0.2:
+                    draw_neon_glow(screen, pit_pos, Dimensions.PIT_RADIUS, glow_color, glow_intensity)
+
+            with profiler.scope("pits.gradient"):
+                draw_radial_gradient(screen, pit_pos, pit_color, Colors.PIT_INACTIVE, Dimensions.PIT_RADIUS)
+
+                border_color = glow_color if mancala[pit_id] > 0 else Colors.PIT_BORDER_INACTIVE
+                pygame.draw.circle(screen, border_color, pit_pos, Dimensions.PIT_RADIUS, width=3)
+
+            # Inner shadow
+            with profiler.scope("pits.shadow"):
+                shadow_surf = pygame.Surface((Dimensions.PIT_RADIUS * 3, Dimensions.PIT_RADIUS * 3), pygame.SRCALPHA)
+                for i in range(5):
+                    alpha = 40 - i * 8
+                    pygame.draw.circle(shadow_surf, (0, 0, 0, alpha),
+                                     (Dimensions.PIT_RADIUS * 1.5, Dimensions.PIT_RADIUS * 1.5),
+                                     Dimensions.PIT_RADIUS - i * 2)
+                screen.blit(shadow_surf, (pit_pos[0] - Dimensions.PIT_RADIUS * 1.5,
+                                          pit_pos[1] - Dimensions.PIT_RADIUS * 1.5))
+
+            with profiler.scope("pits.text"):
+                stone_count = mancala[pit_id]
+                count_color = Colors.TEXT_PRIMARY if stone_count > 0 else Colors.TEXT_SECONDARY
+                draw_text_with_glow(screen, fonts.medium, str(stone_count), pit_pos,
+                                   count_color, glow_color=glow_color if mancala[pit_id] > 0 else None,
+                                   glow_intensity=2 if mancala[pit_id] > 0 else 0)
+
+    with profiler.scope("particles"):
+        animation_manager.draw(screen)
+
+    with profiler.scope("panels"):
+        # AI 1 Panel (bottom left) - FIXED: No overlap with board
+        ai1_panel_rect = pygame.Rect(20, Dimensions.SCREEN_HEIGHT - 160,
+                                      Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, ai1_panel_rect)
+
+        draw_neon_glow(screen, (ai1_panel_rect.x + 40, ai1_panel_rect.y + 30), 15, Colors.PLAYER1_PRIMARY, 0.8)
+        pygame.draw.circle(screen, Colors.PLAYER1_PRIMARY, (ai1_panel_rect.x + 40, ai1_panel_rect.y + 30), 15)
+
+        ai1_title = fonts.small.render("🤖 AI 1 Win Chance", True, Colors.TEXT_SECONDARY)
+        screen.blit(ai1_title, (ai1_panel_rect.x + 70, ai1_panel_rect.y + 20))
+
+        draw_text_with_glow(screen, fonts.large, f"{ai1_prob:.1f}%",
+                           (ai1_panel_rect.x + 70, ai1_panel_rect.y + 65),
+                           Colors.PLAYER1_PRIMARY, glow_color=Colors.PLAYER1_PRIMARY, glow_intensity=2)
+
+        bar_rect = pygame.Rect(ai1_panel_rect.x + 25, ai1_panel_rect.y + 105,
+                              Dimensions.PANEL_WIDTH - 50, 18)
+        from ui_config_enhanced import draw_progress_bar
+        draw_progress_bar(screen, bar_rect, ai1_prob / 100,
+                         Colors.PLAYER1_PRIMARY, Colors.PLAYER1_SECONDARY)
+
+        # AI 2 Panel (top-left corner) - FIXED: Top corner position
+        ai2_panel_rect = pygame.Rect(20, 20, Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, ai2_panel_rect)
+
+        draw_neon_glow(screen, (ai2_panel_rect.x + 40, ai2_panel_rect.y + 30), 15, Colors.PLAYER2_PRIMARY, 0.8)
+        pygame.draw.circle(screen, Colors.PLAYER2_PRIMARY, (ai2_panel_rect.x + 40, ai2_panel_rect.y + 30), 15)
+
+        ai2_title = fonts.small.render("🤖 AI 2 Win Chance", True, Colors.TEXT_SECONDARY)
+        screen.blit(ai2_title, (ai2_panel_rect.x + 70, ai2_panel_rect.y + 20))
+
+        draw_text_with_glow(screen, fonts.large, f"{ai2_prob:.1f}%",
+                           (ai2_panel_rect.x + 70, ai2_panel_rect.y + 65),
+                           Colors.PLAYER2_PRIMARY, glow_color=Colors.PLAYER2_PRIMARY, glow_intensity=2)
+
+        bar_rect = pygame.Rect(ai2_panel_rect.x + 25, ai2_panel_rect.y + 105,
+                              Dimensions.PANEL_WIDTH - 50, 18)
+        draw_progress_bar(screen, bar_rect, ai2_prob / 100,
+                         Colors.PLAYER2_PRIMARY, Colors.PLAYER2_SECONDARY)
+
+        # Move counter
+        move_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - 250, 40, 210, 80)
+        draw_glassmorphic_panel(screen, move_panel_rect)
+
+        move_text = f"Move: {move_count}"
+        draw_text_with_glow(screen, fonts.normal, move_text,
+                           (move_panel_rect.centerx, move_panel_rect.centery),
+                           Colors.TEXT_PRIMARY, glow_color=Colors.NEON_BLUE, glow_intensity=2)
+
+        # Exit hint panel (below move counter)
+        exit_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - 250, 130, 210, 50)
+        draw_glassmorphic_panel(screen, exit_panel_rect)
+
+        exit_text = "Press ESC to quit"
+        draw_text_with_glow(screen, fonts.small, exit_text,
+                           (exit_panel_rect.centerx, exit_panel_rect.centery),
+                           Colors.TEXT_SECONDARY, glow_color=Colors.NEON_PINK, glow_intensity=1)
 
     # Turn indicator
-    animation_manager.draw_turn_indicator(screen, fonts.large)
+    with profiler.scope("turn_indicator"):
+        animation_manager.draw_turn_indicator(screen, fonts.large)
 
-    pygame.display.flip()
+    with profiler.scope("hud"):
+        profiler.draw_hud(screen, fonts.tiny)
+
+    with profiler.scope("flip"):
+        pygame.display.flip()
+    profiler.end_frame()
 
 
 def game_over_popup(message, ai1_score, ai2_score):
@@ -339,6 +361,8 @@ def game_over_popup(message, ai1_score, ai2_score):
 
 
 class Mancala_Board:
+    __slots__ = ('mancala',)
+
     def __init__(self, mancala):
         if mancala is not None:
             self.mancala = mancala[:]
@@ -487,13 +511,26 @@ class Mancala_Board:
             return True
         return False
 
-    def husVal(self):
+    def isDecided(self):
+        """One store holds more than half of all stones, so its owner has won"""
+        return 2 * max(self.mancala[6], self.mancala[13]) > sum(self.mancala)
+
+    def resolve(self):
+        """End a decided game now: each side's stones go to its own store"""
+        self.mancala[6] += sum(self.mancala[0:6])
+        self.mancala[13] += sum(self.mancala[7:13])
+        for i in range(14):
+            if i != 13 and i != 6:
+                self.mancala[i] = 0
+
+    def husVal(self, decided=False):
         """
         Heuristic evaluation function.
         Returns difference in store scores: AI 2's store - AI 1's store
         FIXED: Only considers stones in stores (pit 6 and 13), not remaining stones
+        With decided=True decided games score like finished ones.
         """
-        if self.isEnd():
+        if self.isEnd() or (decided and self.isDecided()):
             if self.mancala[13] > self.mancala[6]:
                 return 100
             elif self.mancala[13] == self.mancala[6]:
@@ -504,91 +541,131 @@ class Mancala_Board:
             return self.mancala[13] - self.mancala[6]
 
 
-def alphabeta(mancala, depth, alpha, beta, MinorMax):
-    """Alpha-beta pruning minimax algorithm with randomization for varied gameplay"""
-    if depth == 0 or mancala.isEnd():
-        # Add small random factor to evaluation to break ties
-        base_val = mancala.husVal()
-        random_factor = random.uniform(-0.5, 0.5)
-        return base_val + random_factor, -1
+def alphabeta(mancala, depth, alpha, beta, MinorMax, budget=None, stop_decided=False):
+    """
+    Alpha-beta pruning minimax algorithm. Deterministic (ties keep the first move),
+    so results can be cached and reproduced; variety comes from choose_ai_move.
+    A mancala_core.SearchBudget aborts the search once spent. With stop_decided
+    decided positions are not searched further.
+    """
+    if budget is not None:
+        budget.tick()
+    if depth == 0 or mancala.isEnd() or (stop_decided and mancala.isDecided()):
+        return mancala.husVal(stop_decided), -1
 
     if MinorMax:  # Maximizing player (AI 2)
         v = -1000000
         player_move = -1
-        # Track moves with similar scores for random selection
-        best_moves = []
-
         for i in range(7, 13, 1):
             if mancala.mancala[i] == 0:
                 continue
             a = Mancala_Board(mancala.mancala[:])
             minormax = a.player_move(i)
-            newv, _ = alphabeta(a, depth - 1, alpha, beta, minormax)
-
-            # If this move is clearly better, use it
-            if newv > v + 1:
+            newv, _ = alphabeta(a, depth - 1, alpha, beta, minormax, budget, stop_decided)
+            if newv > v:
                 player_move = i
                 v = newv
-                best_moves = [(i, newv)]
-            # If moves are similar (within 1 point), add to candidates
-            elif abs(newv - v) <= 1:
-                best_moves.append((i, newv))
-                if newv > v:
-                    v = newv
-
             alpha = max(alpha, v)
             if alpha >= beta:
                 break
-
-        # Randomly select from best moves if there are multiple good options
-        if len(best_moves) > 1:
-            player_move = random.choice(best_moves)[0]
-
         return v, player_move
     else:  # Minimizing player (AI 1)
         v = 1000000
         player_move = -1
-        # Track moves with similar scores for random selection
-        best_moves = []
-
         for i in range(0, 6, 1):
             if mancala.mancala[i] == 0:
                 continue
             a = Mancala_Board(mancala.mancala[:])
             minormax = a.player_move(i)
-            newv, _ = alphabeta(a, depth - 1, alpha, beta, not minormax)
-
-            # If this move is clearly better, use it
-            if newv < v - 1:
+            newv, _ = alphabeta(a, depth - 1, alpha, beta, not minormax, budget, stop_decided)
+            if newv < v:
                 player_move = i
                 v = newv
-                best_moves = [(i, newv)]
-            # If moves are similar (within 1 point), add to candidates
-            elif abs(newv - v) <= 1:
-                best_moves.append((i, newv))
-                if newv < v:
-                    v = newv
-
             beta = min(beta, v)
             if alpha >= beta:
                 break
-
-        # Randomly select from best moves if there are multiple good options
-        if len(best_moves) > 1:
-            player_move = random.choice(best_moves)[0]
-
         return v, player_move
 
 
-def ai_vs_ai():
+# Root move selection: softmax over the root scores (in store seeds) with this
+# temperature, plus with probability AI_EPSILON a uniformly random move among
+# those within ROOT_MARGIN of the best
+AI_TEMPERATURE = 1.0
+AI_EPSILON = 0.05
+# Root moves scoring this much worse than the best only get a bound, not an exact score
+ROOT_MARGIN = 8
+
+
+def root_scores(mancala, depth, MinorMax, budget=None, stop_decided=False):
+    """
+    Deterministic score of every root move: exact within ROOT_MARGIN of the best,
+    otherwise a bound more than ROOT_MARGIN worse (the window stops one short of
+    the margin, so a bound never looks like an exact score at the margin).
+    """
+    scores = {}
+    best = None
+    for i in (range(7, 13) if MinorMax else range(0, 6)):
+        if mancala.mancala[i] == 0:
+            continue
+        a = Mancala_Board(mancala.mancala[:])
+        minormax = a.player_move(i)
+        next_max = minormax if MinorMax else not minormax
+        if MinorMax:
+            alpha = -1000000 if best is None else best - ROOT_MARGIN - 1
+            scores[i], _ = alphabeta(a, depth - 1, alpha, 1000000, next_max, budget, stop_decided)
+            best = scores[i] if best is None else max(best, scores[i])
+        else:
+            beta = 1000000 if best is None else best + ROOT_MARGIN + 1
+            scores[i], _ = alphabeta(a, depth - 1, -1000000, beta, next_max, budget, stop_decided)
+            best = scores[i] if best is None else min(best, scores[i])
+    return scores
+
+
+def choose_ai_move(mancala, MinorMax, max_depth, budget, rng, stop_decided=False):
+    """
+    Score the root moves by budgeted iterative deepening, then let the seeded
+    root policy (mancala_core.select_root_move) pick one of them
+    """
+    scores = {}
+
+    def search(depth, b):
+        depth_scores = root_scores(mancala, depth, MinorMax, b, stop_decided)
+        scores.clear()
+        scores.update(depth_scores)
+        return 0, -1
+
+    search_with_budget(search, max_depth, budget)
+    if not scores:
+        return -1
+    return select_root_move(scores, MinorMax, rng, AI_TEMPERATURE, AI_EPSILON, ROOT_MARGIN)
+
+
+def ai_vs_ai(difficulty=DEFAULT_DIFFICULTY, seed=None, resolve_decided=False):
+    """
+    Both AIs search under the node budget of a DIFFICULTY_LEVELS level (no time
+    limit, so the searches do not depend on machine speed). All randomness (who
+    starts, root move selection) comes from one RNG seeded with 'seed' (a random
+    seed, printed, if None), so a game can be replayed.
+    With resolve_decided the game ends as soon as its winner is known and the
+    searches stop at decided positions.
+    """
+    max_depth, budget = difficulty_budget(difficulty, timed=False)
+    if seed is None:
+        seed = random.randrange(2 ** 32)
+    print(f"AI vs AI seed {seed}")
+    rng = random.Random(seed)
     mancala_board = Mancala_Board(None)
     animation_manager = AnimationManager((Dimensions.SCREEN_WIDTH, Dimensions.SCREEN_HEIGHT))
 
     running = True
     # Randomize who goes first for more varied games
-    ai1_turn = random.choice([True, False])
+    ai1_turn = rng.choice([True, False])
     move_count = 0
     phase = 0
+    decided_shown = False
+
+    def game_over():
+        return mancala_board.isEnd() or (resolve_decided and mancala_board.isDecided())
 
     animation_manager.start_transition(fade_in=True)
     # Show which AI is starting
@@ -634,7 +711,11 @@ def ai_vs_ai():
                     pygame.quit()
                     sys.exit()
 
-        if not mancala_board.isEnd():
+        if not decided_shown and mancala_board.isDecided():
+            decided_shown = True
+            animation_manager.show_turn_indicator("Game Decided!", Colors.NEON_GREEN)
+
+        if not game_over():
             if ai1_turn:
                 # Show "AI 1 Thinking..." - 1 second
                 animation_manager.show_turn_indicator("AI 1 Thinking...", Colors.PLAYER1_PRIMARY)
@@ -654,9 +735,7 @@ def ai_vs_ai():
                              move_count=move_count, phase=phase)
                     clock.tick(60)
 
-                # Randomize AI search depth for variety (3-6)
-                ai_depth = random.randint(3, 6)
-                _, ai_move = alphabeta(mancala_board, ai_depth, -100000, 100000, False)
+                ai_move = choose_ai_move(mancala_board, False, max_depth, budget, rng, resolve_decided)
                 if ai_move != -1:
                     move_count += 1
 
@@ -753,9 +832,7 @@ def ai_vs_ai():
                              move_count=move_count, phase=phase)
                     clock.tick(60)
 
-                # Randomize AI search depth for variety (3-6)
-                ai_depth = random.randint(3, 6)
-                _, ai_move = alphabeta(mancala_board, ai_depth, -100000, 100000, True)
+                ai_move = choose_ai_move(mancala_board, True, max_depth, budget, rng, resolve_decided)
                 if ai_move != -1:
                     move_count += 1
 
@@ -837,7 +914,9 @@ def ai_vs_ai():
         animation_manager.update()
         phase += 0.5
 
-        if mancala_board.isEnd():
+        if game_over():
+            if not mancala_board.isEnd():
+                mancala_board.resolve()
             ai1_score = mancala_board.mancala[6]
             ai2_score = mancala_board.mancala[13]
 
@@ -883,7 +962,7 @@ def ai_vs_ai():
                             # Restart the game
                             waiting = False
                             running = False
-                            ai_vs_ai()  # Restart by calling the function again
+                            ai_vs_ai(difficulty, None, resolve_decided)  # Restart by calling the function again
                             return  # Exit this instance
                         elif event.key == pygame.K_ESCAPE:
                             pygame.quit()
@@ -933,6 +1012,12 @@ def splash_screen():
 
 # Start game directly without splash screen loop
 if __name__ == "__main__":
-    ai_vs_ai()
+    parser = argparse.ArgumentParser(description='Mancala AI vs AI')
+    parser.add_argument('--difficulty', choices=list(DIFFICULTY_LEVELS), default=DEFAULT_DIFFICULTY)
+    parser.add_argument('--seed', type=int, default=None, help='replay a game (seed is printed at start)')
+    parser.add_argument('--resolve-decided', action='store_true',
+                        help='end the game as soon as one store can no longer be caught')
+    args = parser.parse_args()
+    ai_vs_ai(args.difficulty, args.seed, args.resolve_decided)
 
 '''ai_vs_ai_enhanced_fixed.py ends here'''
\ No newline at end of file
@@ -1,40 +1,428 @@
 """
 Headless AI vs AI runner for testing Mancala logic and the alphabeta implementation.
 Runs many games quickly without Pygame and reports win/draw statistics.
+
+Usage:
+    python ai_vs_ai_headless.py                          # alpha-beta vs alpha-beta
+    python ai_vs_ai_headless.py --mcts --games 20        # MCTS vs alpha-beta, per CPU-second
+    python ai_vs_ai_headless.py --engine pvs --workers 4 # parallel games, shared table
+    python ai_vs_ai_headless.py --engine pvs --tt-file pvs.tt   # warm-start from the last run
+    python ai_vs_ai_headless.py --multipv 6 --depth 10   # rank the moves of a position
+    python ai_vs_ai_headless.py --resolve-decided        # stop games once a store has a majority
 """
-from mancala_core import Mancala, alphabeta, INF
+import os
+import sys
+import time
+import argparse
+import multiprocessing
+
+from mancala_core import (Mancala, alphabeta, alphabeta_compound, search_aspiration, search_multipv,
+                          search_mtdf, TranspositionTable, SearchStats, INF, QUIESCENCE_NODES,
+                          set_decided_cutoff)
+from mancala_pns import ProofNumberSearch
+
+def alphabeta_engine(depth, qbudget=0):
+    """
+    Engine callable (state, north_to_move) -> pit using mancala_core.alphabeta, with a
+    quiescence search of qbudget nodes at the horizon when qbudget > 0.
+    The SearchStats of the last move are left in engine.last_stats.
+    """
+    def engine(state, north_to_move):
+        engine.last_stats = SearchStats()
+        _, best = alphabeta(state, depth, -INF, INF, north_to_move, engine.last_stats, 0, qbudget)
+        return best
+    engine.last_stats = None
+    return engine
+
+def pvs_engine(depth, tt=None):
+    """
+    Engine using iterative-deepening PVS with aspiration windows.
+    Uses a per-game table unless tt (e.g. a SharedTranspositionTable) is given.
+    """
+    if tt is None: tt = TranspositionTable()
+    def engine(state, north_to_move):
+        engine.last_stats = SearchStats()
+        _, best = search_aspiration(state, depth, north_to_move, stats=engine.last_stats, tt=tt)
+        return best
+    engine.last_stats = None
+    return engine
+
+def mtdf_engine(depth, tt=None):
+    """Engine using iterative-deepening MTD(f); a per-game table unless tt is given"""
+    if tt is None: tt = TranspositionTable()
+    def engine(state, north_to_move):
+        engine.last_stats = SearchStats()
+        _, best = search_mtdf(state, depth, north_to_move, stats=engine.last_stats, tt=tt)
+        return best
+    engine.last_stats = None
+    return engine
+
+PNS_NODES = 2_000       # df-pn nodes per move before falling back to pvs
+PNS_MAX_SEEDS = 20      # try proofs once at most this many seeds are left on the board
+
+def pns_engine(depth, tt=None):
+    """
+    pvs engine with a df-pn root mode: once few seeds are left or the game is
+    decided (Mancala.is_decided) it first tries to prove a win within PNS_NODES
+    nodes and, if a win is disproven, at least a draw. After a proof it plays the
+    proof's moves without searching for the rest of the game; engine.proven is the
+    margin proven (1 win, 0 draw, None before any proof), and a proven draw still
+    looks for a win each move. engine.proofs counts moves played from a proof.
+    """
+    prover = ProofNumberSearch()
+    fallback = pvs_engine(depth, tt)
+    def engine(state, north_to_move):
+        board = sum(state.a) - state.a[Mancala.NORTH_STORE] - state.a[Mancala.SOUTH_STORE]
+        if engine.proven is not None or board <= PNS_MAX_SEEDS or state.is_decided():
+            for margin in (1, 0):
+                if engine.proven is not None and margin < engine.proven:
+                    break
+                max_nodes = None if margin == engine.proven else PNS_NODES
+                result = prover.prove(state, north_to_move, north_to_move, margin, max_nodes)
+                if result:
+                    engine.proven = margin
+                    engine.proofs += 1
+                    engine.last_stats = None
+                    return prover.winning_move(state, north_to_move, margin)
+                if result is None and engine.proven is None:
+                    break   # out of nodes: a draw would not be cheaper to prove
+        best = fallback(state, north_to_move)
+        engine.last_stats = fallback.last_stats
+        return best
+    engine.proven = None
+    engine.proofs = 0
+    engine.last_stats = None
+    return engine
+
+def compound_engine(depth):
+    """
+    Engine using alphabeta_compound: one search picks the whole extra-turn chain and
+    the rest of the chain is replayed on the following calls, as long as the board
+    is the one the chain leads to.
+    """
+    def engine(state, north_to_move):
+        expected, rest = engine.pending
+        if rest and expected == (tuple(state.a), north_to_move):
+            seq = rest
+            engine.last_stats = None
+        else:
+            engine.last_stats = SearchStats()
+            _, seq = alphabeta_compound(state, depth, -INF, INF, north_to_move, engine.last_stats)
+            if not seq:
+                return -1
+        after = state.copy()
+        after.move(seq[0], None, north_to_move)
+        engine.pending = ((tuple(after.a), north_to_move), seq[1:])
+        return seq[0]
+    engine.last_stats = None
+    engine.pending = (None, ())
+    return engine
 
-def play_game(depth_south=6, depth_north=6, verbose=False):
+def quiescence_engine(depth):
+    """alphabeta_engine with the default quiescence budget at the horizon"""
+    return alphabeta_engine(depth, QUIESCENCE_NODES)
+
+ENGINES = {'alphabeta': alphabeta_engine, 'pvs': pvs_engine, 'mtdf': mtdf_engine, 'pns': pns_engine,
+           'compound': compound_engine, 'quiescence': quiescence_engine}
+
+def print_move_stats(ply, north_to_move, pit, stats):
+    """on_move hook for play_game: one line per move with nodes and NPS"""
+    side = 'N' if north_to_move else 'S'
+    if isinstance(stats, SearchStats):
+        print(f"{ply:3d} {side} pit {pit:2d}  depth {stats.depth} seldepth {stats.seldepth:2d}  "
+              f"nodes {stats.nodes:8d}  nps {stats.nps:9,.0f}  {stats.elapsed * 1000:7.1f}ms  "
+              f"pv {' '.join(map(str, stats.pv))}")
+    elif isinstance(stats, dict):
+        print(f"{ply:3d} {side} pit {pit:2d}  playouts {stats.get('playouts', 0):8d}  "
+              f"playouts/s {stats.get('playouts_per_sec', 0):9,.0f}")
+    else:
+        print(f"{ply:3d} {side} pit {pit:2d}")
+
+def play_game(depth_south=6, depth_north=6, verbose=False, engine_south=None, engine_north=None,
+              cpu_times=None, on_move=None, resolve_decided=False):
+    """
+    Play one game; each side uses its engine or alpha-beta at its depth.
+    With resolve_decided the game ends as soon as a store holds more than half the
+    seeds (the winner is known), each side keeping the seeds on its side, and for
+    this game only the searches stop at decided positions (set_decided_cutoff).
+    CPU seconds spent choosing moves are added to cpu_times['south'/'north'].
+    on_move(ply, north_to_move, pit, stats) is called after every search with the
+    engine's last_stats (SearchStats, an MCTS stats dict or None).
+    """
+    if engine_south is None: engine_south = alphabeta_engine(depth_south)
+    if engine_north is None: engine_north = alphabeta_engine(depth_north)
     state = Mancala()
     north_to_move = False
+    ply = 0
+
+    previous = set_decided_cutoff(resolve_decided)
+    try:
+        while True:
+            decided = resolve_decided and state.is_decided()
+            if decided or state.is_terminal():
+                if decided: state.resolve()
+                else: state.finalize_if_terminal()
+                ns, ss = state.a[Mancala.NORTH_STORE], state.a[Mancala.SOUTH_STORE]
+                if verbose: print(f"Final {ns}-{ss}{' (decided)' if decided else ''}")
+                if ns > ss: return 'north', ns-ss
+                if ss > ns: return 'south', ss-ns
+                return 'draw', 0
 
-    while True:
-        if state.is_terminal():
-            state.finalize_if_terminal()
-            ns, ss = state.a[Mancala.NORTH_STORE], state.a[Mancala.SOUTH_STORE]
-            if verbose: print(f"Final {ns}-{ss}")
-            if ns > ss: return 'north', ns-ss
-            if ss > ns: return 'south', ss-ns
-            return 'draw', 0
-
-        depth = depth_north if north_to_move else depth_south
-        _, best = alphabeta(state, depth, -INF, INF, north_to_move)
-        if best == -1:
-            state.finalize_if_terminal(); continue
-
-        repeat = state.move(best, draw_step=None, north_turn=north_to_move, step_delay_ms=0)
-        if not repeat:
-            north_to_move = not north_to_move
-
-def run_tournament(n=50, depth_a=6, depth_b=6):
+            engine = engine_north if north_to_move else engine_south
+            start = time.process_time()
+            best = engine(state, north_to_move)
+            if cpu_times is not None:
+                side = 'north' if north_to_move else 'south'
+                cpu_times[side] = cpu_times.get(side, 0.0) + time.process_time() - start
+            ply += 1
+            if on_move is not None:
+                on_move(ply, north_to_move, best, getattr(engine, 'last_stats', None))
+            if best == -1:
+                state.finalize_if_terminal(); continue
+
+            repeat = state.move(best, draw_step=None, north_turn=north_to_move, step_delay_ms=0)
+            if not repeat:
+                north_to_move = not north_to_move
+    finally:
+        set_decided_cutoff(previous)
+
+def run_tournament(n=50, depth_a=6, depth_b=6, engine='alphabeta', on_move=None, tt=None,
+                   resolve_decided=False):
+    """Play n games; pvs engines share 'tt' across all games when it is given"""
     stats = {'north':0, 'south':0, 'draw':0}
+    make = ENGINES[engine]
+    if tt is not None and engine == 'pvs':
+        make = lambda depth: pvs_engine(depth, tt)
     for i in range(n):
-        winner, margin = play_game(depth_a, depth_b)
+        winner, margin = play_game(depth_a, depth_b, engine_south=make(depth_a), engine_north=make(depth_b),
+                                   on_move=on_move, resolve_decided=resolve_decided)
         stats[winner] += 1
     return stats
 
+# ---------------- Parallel tournaments ----------------
+
+_worker_tt = None
+
+def _init_worker(tt_name):
+    """Pool initializer: attach to the tournament's shared table"""
+    global _worker_tt
+    if tt_name is not None:
+        from mancala_shared_tt import SharedTranspositionTable
+        _worker_tt = SharedTranspositionTable(name=tt_name)
+
+def _play_task(task):
+    """Play one game in a worker; returns the result with this game's table and node counters"""
+    depth_a, depth_b, engine, resolve_decided = task
+    if engine == 'pvs' and _worker_tt is not None:
+        make = lambda depth: pvs_engine(depth, _worker_tt)
+        before = _worker_tt.counters()
+    else:
+        make, before = ENGINES[engine], None
+    search = {'nodes': 0, 'moves': 0}
+    def count(ply, north_to_move, pit, stats):
+        if isinstance(stats, SearchStats):
+            search['nodes'] += stats.nodes
+            search['moves'] += 1
+    winner, margin = play_game(depth_a, depth_b, engine_south=make(depth_a), engine_north=make(depth_b),
+                               on_move=count, resolve_decided=resolve_decided)
+    if before is not None:
+        after = _worker_tt.counters()
+        search.update({k: after[k] - before[k] for k in after})
+    return winner, margin, os.getpid(), search
+
+def run_parallel_tournament(n=50, depth_a=6, depth_b=6, engine='pvs', workers=None, shared=True,
+                            tt_entries=1 << 22, tt_file=None, resolve_decided=False):
+    """
+    Play n games in a pool of worker processes. With shared=True the pvs engines of
+    all workers use one SharedTranspositionTable, so later games reuse the positions
+    searched by earlier ones; tt_file warm-starts that table from a snapshot and
+    saves it afterwards. Returns (results, metrics): metrics has per-worker and
+    global table probes/hits/stores and search nodes/moves. resolve_decided is
+    passed to play_game; the values its searches store are not exact, so it cannot
+    be combined with tt_file.
+    """
+    if resolve_decided and tt_file is not None:
+        raise ValueError("resolve_decided tables hold inexact values and cannot be saved to a snapshot")
+    tt = None
+    if shared and engine == 'pvs':
+        from mancala_shared_tt import SharedTranspositionTable
+        tt = SharedTranspositionTable(tt_entries)
+        if tt_file is not None and not load_snapshot(tt, tt_file):
+            tt_file = None
+    results = {'north':0, 'south':0, 'draw':0}
+    per_worker = {}
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker,
+                                  initargs=(tt.name if tt is not None else None,)) as pool:
+            for winner, margin, pid, search in pool.imap_unordered(_play_task, [(depth_a, depth_b, engine, resolve_decided)] * n):
+                results[winner] += 1
+                totals = per_worker.setdefault(pid, {'games': 0})
+                totals['games'] += 1
+                for k, v in search.items():
+                    totals[k] = totals.get(k, 0) + v
+        metrics = {'workers': per_worker, 'global': {}}
+        for totals in per_worker.values():
+            for k, v in totals.items():
+                metrics['global'][k] = metrics['global'].get(k, 0) + v
+        if tt is not None:
+            metrics['global']['entries_used'] = len(tt)
+            if tt_file is not None:
+                save_snapshot(tt, tt_file)
+    finally:
+        if tt is not None:
+            tt.close()
+            tt.unlink()
+    return results, metrics
+
+def load_snapshot(tt, path):
+    """
+    Warm-start a table from a snapshot file, if there is a usable one. Returns False
+    when the file exists but was rejected, so it must not be overwritten.
+    """
+    if not os.path.exists(path):
+        print(f"No table snapshot at {path}, starting empty")
+        return True
+    try:
+        elapsed = tt.load(path)
+    except ValueError as e:
+        print(f"Ignoring table snapshot {path}: {e}; it will not be overwritten")
+        return False
+    print(f"Loaded {len(tt):,} table entries from {path} in {elapsed * 1000:.0f}ms")
+    return True
+
+def save_snapshot(tt, path):
+    elapsed = tt.save(path)
+    print(f"Saved {len(tt):,} table entries to {path} in {elapsed * 1000:.0f}ms "
+          f"({os.path.getsize(path):,} bytes)")
+
+def print_tournament_metrics(metrics):
+    def line(label, totals):
+        probes, hits = totals.get('probes', 0), totals.get('hits', 0)
+        rate = f"hit rate {hits / probes:6.1%} ({hits}/{probes})" if probes else "no shared table"
+        per_move = totals['nodes'] / totals['moves'] if totals.get('moves') else 0
+        print(f"{label:<14} games {totals['games']:3d}  {rate}  nodes/move {per_move:9,.0f}")
+    for pid, totals in sorted(metrics['workers'].items()):
+        line(f"worker {pid}", totals)
+    line('global', metrics['global'])
+
+def compare_engines(n, make_a, make_b, on_move=None, resolve_decided=False):
+    """
+    Play n games between two engine factories, swapping sides every game.
+    Returns wins per engine ('a', 'b', 'draw') and CPU seconds and moves per engine.
+    """
+    stats = {'a':0, 'b':0, 'draw':0, 'cpu_a':0.0, 'cpu_b':0.0}
+    for i in range(n):
+        a_north = i % 2 == 1
+        engine_a, engine_b = make_a(), make_b()
+        cpu = {}
+        if a_north:
+            winner, _ = play_game(engine_south=engine_b, engine_north=engine_a, cpu_times=cpu,
+                                  on_move=on_move, resolve_decided=resolve_decided)
+        else:
+            winner, _ = play_game(engine_south=engine_a, engine_north=engine_b, cpu_times=cpu,
+                                  on_move=on_move, resolve_decided=resolve_decided)
+        a_side, b_side = ('north', 'south') if a_north else ('south', 'north')
+        stats['cpu_a'] += cpu.get(a_side, 0.0)
+        stats['cpu_b'] += cpu.get(b_side, 0.0)
+        if winner == 'draw': stats['draw'] += 1
+        elif winner == a_side: stats['a'] += 1
+        else: stats['b'] += 1
+    return stats
+
+def print_multipv(board, north_to_move, depth, k):
+    """Analyse one position: the k best moves with scores and principal variations"""
+    stats = SearchStats()
+    lines = search_multipv(Mancala(board), depth, north_to_move, k, stats=stats)
+    side = 'North' if north_to_move else 'South'
+    print(f"{side} to move, depth {depth}: {stats.nodes:,} nodes in {stats.elapsed:.2f}s")
+    for rank, (value, move, pv) in enumerate(lines, 1):
+        print(f"{rank}. pit {move:2d}  score {value:6d}  pv {' '.join(map(str, pv))}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless Mancala AI vs AI')
+    parser.add_argument('--games', type=int, default=50)
+    parser.add_argument('--depth', type=int, default=6, help='search depth')
+    parser.add_argument('--engine', choices=sorted(ENGINES), default='alphabeta',
+                        help='search used by both sides (and as the MCTS opponent)')
+    parser.add_argument('--mcts', action='store_true', help='play MCTS against --engine')
+    parser.add_argument('--iterations', type=int, default=2000, help='MCTS leaves per move')
+    parser.add_argument('--time-limit', type=float, default=None, help='MCTS seconds per move')
+    parser.add_argument('--variant', choices=('uct', 'puct'), default='uct')
+    parser.add_argument('--rollout', choices=('random', 'greedy'), default='random')
+    parser.add_argument('--stats', action='store_true', help='print nodes and NPS for every move')
+    parser.add_argument('--workers', type=int, default=0, help='play games in N worker processes')
+    parser.add_argument('--no-shared-tt', action='store_true',
+                        help='parallel pvs games keep per-game tables instead of one shared table')
+    parser.add_argument('--tt-entries', type=int, default=1 << 22, help='shared table slots (16 bytes each)')
+    parser.add_argument('--tt-file', default=None,
+                        help='pvs table snapshot: loaded at startup if valid, saved on exit')
+    parser.add_argument('--multipv', type=int, default=0, metavar='K',
+                        help='print the K best moves of --board (default: start) and exit')
+    parser.add_argument('--board', type=int, nargs=14, default=None, help='14-slot board for --multipv')
+    parser.add_argument('--north', action='store_true', help='North to move in --board')
+    parser.add_argument('--resolve-decided', action='store_true',
+                        help='end games once a store holds a majority and stop searching decided positions')
+    args = parser.parse_args(argv)
+    if args.resolve_decided and args.tt_file:
+        parser.error('--resolve-decided stores inexact values in the table and cannot be used with --tt-file')
+    if args.multipv:
+        print_multipv(args.board or Mancala().a, args.north, args.depth, args.multipv)
+        return 0
+    on_move = print_move_stats if args.stats else None
+
+    if args.workers and not args.mcts:
+        shared = not args.no_shared_tt and args.engine == 'pvs'
+        print(f'Running {args.games} headless games ({args.engine}, both depth={args.depth}) '
+              f'in {args.workers} processes{", shared table" if shared else ""}')
+        start = time.perf_counter()
+        stats, metrics = run_parallel_tournament(args.games, args.depth, args.depth, args.engine,
+                                                 args.workers, shared, args.tt_entries, args.tt_file,
+                                                 args.resolve_decided)
+        print('Results:', stats)
+        print_tournament_metrics(metrics)
+        print(f"Wall time {time.perf_counter() - start:.1f}s")
+        return 0
+
+    if not args.mcts:
+        print(f'Running {args.games} headless games ({args.engine}, both depth={args.depth})')
+        tt = tt_file = None
+        if args.tt_file and args.engine == 'pvs':
+            tt = TranspositionTable()
+            if load_snapshot(tt, args.tt_file):
+                tt_file = args.tt_file
+        start = time.perf_counter()
+        stats = run_tournament(args.games, args.depth, args.depth, args.engine, on_move, tt,
+                               args.resolve_decided)
+        print('Results:', stats)
+        print(f"Wall time {time.perf_counter() - start:.1f}s")
+        if tt_file is not None:
+            save_snapshot(tt, tt_file)
+        return 0
+
+    from mancala_mcts import MCTS
+    engines = []
+    def make_mcts():
+        engines.append(MCTS(iterations=args.iterations, time_limit=args.time_limit,
+                            variant=args.variant, rollout=args.rollout))
+        return engines[-1]
+
+    print(f'Running {args.games} games: MCTS ({args.variant}, {args.iterations} iterations, '
+          f'{args.rollout} rollouts) vs {args.engine} depth {args.depth}')
+    stats = compare_engines(args.games, make_mcts, lambda: ENGINES[args.engine](args.depth), on_move,
+                            args.resolve_decided)
+    games = max(args.games, 1)
+    print(f"MCTS wins {stats['a']}, {args.engine} wins {stats['b']}, draws {stats['draw']}")
+    print(f"CPU seconds per game: MCTS {stats['cpu_a'] / games:.2f}, "
+          f"{args.engine} {stats['cpu_b'] / games:.2f}")
+    if stats['cpu_a'] > 0:
+        playouts = sum(engine.total_playouts for engine in engines)
+        print(f"MCTS playouts per CPU-second: {playouts / stats['cpu_a']:,.0f}")
+    for label, wins, cpu in (('MCTS', stats['a'], stats['cpu_a']),
+                             (args.engine, stats['b'], stats['cpu_b'])):
+        score = wins + stats['draw'] / 2
+        print(f"{label:<11} score {score:5.1f}/{games}  per CPU-second {score / cpu if cpu else 0:.3f}")
+    return 0
+
 if __name__ == '__main__':
-    print('Running 50 headless games (both depth=6)')
-    stats = run_tournament(50, 6, 6)
-    print('Results:', stats)
+    sys.exit(main())
 '''ai_vs_ai_headless.py ends here'''
\ No newline at end of file
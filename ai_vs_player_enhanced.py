@@ -6,6 +6,8 @@ import pygame
 import sys
 import time
 import random
+import argparse
+import threading
 import numpy as np
 import skfuzzy as fuzz
 from skfuzzy import control as ctrl
@@ -15,6 +17,8 @@ from ui_config_enhanced import (Colors, Dimensions, fonts, draw_gradient_rect,
                                  draw_radial_gradient, draw_progress_bar,
                                  draw_animated_border, LayoutCalculator)
 from animations_enhanced import AnimationManager
+from profiler_enhanced import profiler
+from mancala_core import DIFFICULTY_LEVELS, DEFAULT_DIFFICULTY, difficulty_budget, search_with_budget
 
 pygame.init()
 
@@ -105,7 +109,10 @@ def draw_animated_background(surface, phase):
 def draw_board(mancala, animation_manager, highlight_pit=None, probability=0,
                turn_message="", suggested_move=None, hover_pit=None, phase=0, move_count=0):
     """Draw the ultra-modern game board"""
-    draw_animated_background(screen, phase)
+    profiler.poll_toggle()
+    
+    with profiler.scope("background"):
+        draw_animated_background(screen, phase)
     
     board_rect = LayoutCalculator.get_board_rect(Dimensions.SCREEN_WIDTH, Dimensions.SCREEN_HEIGHT)
     pit_positions = LayoutCalculator.get_pit_positions(board_rect)
@@ -113,231 +120,246 @@ def draw_board(mancala, animation_manager, highlight_pit=None, probability=0,
     
     shake_offset = animation_manager.get_shake_offset()
     
-    # Board with glassmorphism
-    board_surf = pygame.Surface((board_rect.width, board_rect.height), pygame.SRCALPHA)
+    with profiler.scope("board"):
+        # Board with glassmorphism
+        board_surf = pygame.Surface((board_rect.width, board_rect.height), pygame.SRCALPHA)
     
-    # Outer glow
-    glow_rect = board_rect.inflate(Dimensions.BOARD_GLOW_RADIUS * 2, 
-                                   Dimensions.BOARD_GLOW_RADIUS * 2)
-    draw_neon_glow(screen, glow_rect.center, board_rect.width // 2, Colors.BOARD_GLOW, 0.3)
+        # Outer glow
+        glow_rect = board_rect.inflate(Dimensions.BOARD_GLOW_RADIUS * 2, 
+                                       Dimensions.BOARD_GLOW_RADIUS * 2)
+        draw_neon_glow(screen, glow_rect.center, board_rect.width // 2, Colors.BOARD_GLOW, 0.3)
     
-    # Board background
-    draw_triple_gradient_rect(board_surf, Colors.BOARD_PRIMARY, Colors.BOARD_SECONDARY,
-                              Colors.BOARD_PRIMARY,
-                              pygame.Rect(0, 0, board_rect.width, board_rect.height),
-                              vertical=False, border_radius=Dimensions.BOARD_BORDER_RADIUS)
+        # Board background
+        draw_triple_gradient_rect(board_surf, Colors.BOARD_PRIMARY, Colors.BOARD_SECONDARY,
+                                  Colors.BOARD_PRIMARY,
+                                  pygame.Rect(0, 0, board_rect.width, board_rect.height),
+                                  vertical=False, border_radius=Dimensions.BOARD_BORDER_RADIUS)
     
-    board_surf.set_alpha(220)
-    screen.blit(board_surf, (board_rect.x + shake_offset[0], board_rect.y + shake_offset[1]))
+        board_surf.set_alpha(220)
+        screen.blit(board_surf, (board_rect.x + shake_offset[0], board_rect.y + shake_offset[1]))
     
-    # Animated border
-    draw_animated_border(screen, board_rect.move(shake_offset[0], shake_offset[1]),
-                        Colors.BOARD_BORDER, phase, width=4,
-                        border_radius=Dimensions.BOARD_BORDER_RADIUS)
-    
-    # Inner highlight
-    inner_rect = board_rect.inflate(-10, -10).move(shake_offset[0], shake_offset[1])
-    border_color = Colors.GLASS_BORDER[:3] if len(Colors.GLASS_BORDER) > 3 else Colors.GLASS_BORDER
-    pygame.draw.rect(screen, (*border_color, 100), inner_rect, width=2,
-                    border_radius=Dimensions.BOARD_BORDER_RADIUS - 5)
-    
-    # Draw mancala stores with neon effect
-    for store_id, store_rect in mancala_positions.items():
-        is_player = store_id == 6
-        color1 = Colors.PLAYER1_PRIMARY if is_player else Colors.PLAYER2_PRIMARY
-        color2 = Colors.PLAYER1_SECONDARY if is_player else Colors.PLAYER2_SECONDARY
-        
-        # Glow effect
-        draw_neon_glow(screen, 
-                      (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1]),
-                      store_rect.width // 2, color1, 0.4)
-        
-        # Store background
-        store_surf = pygame.Surface((store_rect.width, store_rect.height), pygame.SRCALPHA)
-        draw_gradient_rect(store_surf, color1, color2,
-                          pygame.Rect(0, 0, store_rect.width, store_rect.height),
-                          vertical=True, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
-        store_surf.set_alpha(200)
-        screen.blit(store_surf, (store_rect.x + shake_offset[0], store_rect.y + shake_offset[1]))
-        
-        # Border with glow
-        border_color = color1 if is_player else color2
-        pygame.draw.rect(screen, border_color,
-                        store_rect.move(shake_offset[0], shake_offset[1]),
-                        width=4, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
-        
-        # Score with glow effect
-        score = str(mancala[store_id])
-        text_pos = (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1])
-        draw_text_with_glow(screen, fonts.large, score, text_pos, Colors.TEXT_PRIMARY,
-                           glow_color=border_color, glow_intensity=3)
-    
-    # Draw pits with hover effects
-    for pit_id, pos in pit_positions.items():
-        is_player_pit = 0 <= pit_id <= 5
-        is_highlighted = highlight_pit == pit_id
-        is_suggested = suggested_move == pit_id
-        is_hover = hover_pit == pit_id
-        can_play = is_player_pit and mancala[pit_id] > 0
-        
-        pit_pos = (pos[0] + shake_offset[0], pos[1] + shake_offset[1])
-        
-        # Add/update hover effect
-        hover_effect = animation_manager.add_hover_effect(pit_id, pit_pos, Dimensions.PIT_RADIUS)
-        current_radius = hover_effect.get_scaled_radius()
-        
-        # Determine pit color and glow
-        if is_highlighted:
-            pit_color = Colors.PIT_SELECTED
-            glow_color = Colors.NEON_YELLOW
-            glow_intensity = 1.2
-        elif is_suggested:
-            pit_color = Colors.PIT_ACTIVE
-            glow_color = Colors.NEON_ORANGE
-            glow_intensity = 0.8
-        elif is_hover and can_play:
-            pit_color = Colors.PIT_HOVER
-            glow_color = Colors.PLAYER1_PRIMARY
-            glow_intensity = 0.6
-        elif can_play:
-            pit_color = Colors.PIT_ACTIVE
-            glow_color = Colors.PLAYER1_PRIMARY
-            glow_intensity = 0.3
-        else:
-            pit_color = Colors.PIT_INACTIVE
-            glow_color = Colors.PIT_BORDER_INACTIVE
-            glow_intensity = 0.1
-        
-        # Glow effect
-        if glow_intensity > 0.2:
-            draw_neon_glow(screen, pit_pos, current_radius, glow_color, glow_intensity)
-        
-        # Pit background with radial gradient
-        draw_radial_gradient(screen, pit_pos, pit_color, Colors.PIT_INACTIVE, current_radius)
-        
-        # Border
-        border_color = glow_color if can_play or is_highlighted else Colors.PIT_BORDER_INACTIVE
-        pygame.draw.circle(screen, border_color, pit_pos, current_radius, width=3)
-        
-        # Inner shadow
-        shadow_surf = pygame.Surface((current_radius * 3, current_radius * 3), pygame.SRCALPHA)
-        for i in range(5):
-            alpha = 40 - i * 8
-            pygame.draw.circle(shadow_surf, (0, 0, 0, alpha),
-                             (current_radius * 1.5, current_radius * 1.5),
-                             current_radius - i * 2)
-        screen.blit(shadow_surf, (pit_pos[0] - current_radius * 1.5, 
-                                  pit_pos[1] - current_radius * 1.5))
-        
-        # Stone count with glow
-        stone_count = mancala[pit_id]
-        count_color = Colors.TEXT_PRIMARY if stone_count > 0 else Colors.TEXT_SECONDARY
-        draw_text_with_glow(screen, fonts.medium, str(stone_count), pit_pos,
-                           count_color, glow_color=glow_color if can_play else None,
-                           glow_intensity=2 if can_play else 0)
-        
-        # Pit number label - FIXED: Inside pit, no overlap
-        label_color = Colors.TEXT_SECONDARY if stone_count == 0 else (*Colors.TEXT_SECONDARY, 180)
-        label = fonts.tiny.render(str(pit_id + 1), True, label_color)
-        # Position label at bottom of pit, inside the circle
-        label_y = pit_pos[1] + current_radius - 15
-        label_rect = label.get_rect(center=(pit_pos[0], label_y))
-        screen.blit(label, label_rect)
-    
-    # Draw animations
-    animation_manager.draw(screen)
-    
-    # Player Win Chance Panel (bottom-left)
-    player_panel_rect = pygame.Rect(20, Dimensions.SCREEN_HEIGHT - 160, 
-                                     Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, player_panel_rect)
-    
-    draw_neon_glow(screen, (player_panel_rect.x + 40, player_panel_rect.y + 30), 15, Colors.PLAYER1_PRIMARY, 0.8)
-    pygame.draw.circle(screen, Colors.PLAYER1_PRIMARY, (player_panel_rect.x + 40, player_panel_rect.y + 30), 15)
-    
-    player_title = fonts.small.render("🎮 Your Win Chance", True, Colors.TEXT_SECONDARY)
-    screen.blit(player_title, (player_panel_rect.x + 70, player_panel_rect.y + 20))
-    
-    draw_text_with_glow(screen, fonts.large, f"{probability:.1f}%",
-                       (player_panel_rect.x + 70, player_panel_rect.y + 65),
-                       Colors.PLAYER1_PRIMARY, glow_color=Colors.PLAYER1_PRIMARY, glow_intensity=2)
-    
-    bar_rect = pygame.Rect(player_panel_rect.x + 25, player_panel_rect.y + 105,
-                          Dimensions.PANEL_WIDTH - 50, 18)
-    draw_progress_bar(screen, bar_rect, probability / 100,
-                     Colors.PLAYER1_PRIMARY, Colors.PLAYER1_SECONDARY)
-    
-    # AI Win Chance Panel (top-left)
-    ai_panel_rect = pygame.Rect(20, 20, Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, ai_panel_rect)
-    
-    draw_neon_glow(screen, (ai_panel_rect.x + 40, ai_panel_rect.y + 30), 15, Colors.PLAYER2_PRIMARY, 0.8)
-    pygame.draw.circle(screen, Colors.PLAYER2_PRIMARY, (ai_panel_rect.x + 40, ai_panel_rect.y + 30), 15)
-    
-    ai_title = fonts.small.render("🤖 AI Win Chance", True, Colors.TEXT_SECONDARY)
-    screen.blit(ai_title, (ai_panel_rect.x + 70, ai_panel_rect.y + 20))
-    
-    ai_probability = 100 - probability
-    draw_text_with_glow(screen, fonts.large, f"{ai_probability:.1f}%",
-                       (ai_panel_rect.x + 70, ai_panel_rect.y + 65),
-                       Colors.PLAYER2_PRIMARY, glow_color=Colors.PLAYER2_PRIMARY, glow_intensity=2)
-    
-    bar_rect2 = pygame.Rect(ai_panel_rect.x + 25, ai_panel_rect.y + 105,
-                           Dimensions.PANEL_WIDTH - 50, 18)
-    draw_progress_bar(screen, bar_rect2, ai_probability / 100,
-                     Colors.PLAYER2_PRIMARY, Colors.PLAYER2_SECONDARY)
-    
-    # Move counter panel (top-right)
-    move_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - Dimensions.PANEL_WIDTH - 20, 20,
-                                   Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, move_panel_rect,
-                           bg_color=(*Colors.NEON_BLUE, 40),
-                           border_color=Colors.NEON_BLUE)
-    
-    move_text = f"Move: {move_count}"
-    draw_text_with_glow(screen, fonts.normal, move_text,
-                       (move_panel_rect.centerx, move_panel_rect.centery),
-                       Colors.TEXT_PRIMARY, glow_color=Colors.NEON_BLUE, glow_intensity=2)
-    
-    # ESC button panel (below move counter)
-    esc_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - Dimensions.PANEL_WIDTH - 20,
-                                  move_panel_rect.bottom + 15,
-                                  Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
-    draw_glassmorphic_panel(screen, esc_panel_rect,
-                           bg_color=(*Colors.NEON_PURPLE, 40),
-                           border_color=Colors.GLASS_BORDER)
-    
-    esc_text = fonts.small.render("Press ESC to quit", True, Colors.TEXT_SECONDARY)
-    esc_rect = esc_text.get_rect(center=(esc_panel_rect.centerx, esc_panel_rect.centery))
-    screen.blit(esc_text, esc_rect)
-    
-    # AI Suggestion panel (below player panel if active)
-    if suggested_move is not None:
-        suggest_rect = pygame.Rect(20, player_panel_rect.bottom + 15, 
-                                    Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
-        draw_glassmorphic_panel(screen, suggest_rect, 
-                               bg_color=(*Colors.NEON_ORANGE, 60),
-                               border_color=Colors.NEON_ORANGE)
-        
-        # Lightning icon
-        icon_x = suggest_rect.x + 30
-        icon_y = suggest_rect.centery
-        draw_neon_glow(screen, (icon_x, icon_y), 12, Colors.NEON_YELLOW, 1.0)
-        
-        # Text
-        suggest_title = fonts.small.render("💡 AI Suggestion", True, Colors.TEXT_PRIMARY)
-        screen.blit(suggest_title, (suggest_rect.x + 60, suggest_rect.y + 20))
-        
-        suggest_text = f"Play Pit {suggested_move + 1}"
-        draw_text_with_glow(screen, fonts.normal, suggest_text,
-                           (suggest_rect.x + 60, suggest_rect.y + 50),
-                           Colors.NEON_YELLOW, glow_color=Colors.NEON_ORANGE,
-                           glow_intensity=2)
-    
-    # Turn indicator
-    animation_manager.draw_turn_indicator(screen, fonts.large)
+        # Animated border
+        draw_animated_border(screen, board_rect.move(shake_offset[0], shake_offset[1]),
+                            Colors.BOARD_BORDER, phase, width=4,
+                            border_radius=Dimensions.BOARD_BORDER_RADIUS)
     
-    pygame.display.flip()
+        # Inner highlight
+        inner_rect = board_rect.inflate(-10, -10).move(shake_offset[0], shake_offset[1])
+        border_color = Colors.GLASS_BORDER[:3] if len(Colors.GLASS_BORDER) > 3 else Colors.GLASS_BORDER
+        pygame.draw.rect(screen, (*border_color, 100), inner_rect, width=2,
+                        border_radius=Dimensions.BOARD_BORDER_RADIUS - 5)
+    
+    with profiler.scope("stores"):
+        # Draw mancala stores with neon effect
+        for store_id, store_rect in mancala_positions.items():
+            is_player = store_id == 6
+            color1 = Colors.PLAYER1_PRIMARY if is_player else Colors.PLAYER2_PRIMARY
+            color2 = Colors.PLAYER1_SECONDARY if is_player else Colors.PLAYER2_SECONDARY
+        
+            # Glow effect
+            draw_neon_glow(screen, 
+                          (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1]),
+                          store_rect.width // 2, color1, 0.4)
+        
+            # Store background
+            store_surf = pygame.Surface((store_rect.width, store_rect.height), pygame.SRCALPHA)
+            draw_gradient_rect(store_surf, color1, color2,
+                              pygame.Rect(0, 0, store_rect.width, store_rect.height),
+                              vertical=True, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
+            store_surf.set_alpha(200)
+            screen.blit(store_surf, (store_rect.x + shake_offset[0], store_rect.y + shake_offset[1]))
+        
+            # Border with glow
+            border_color = color1 if is_player else color2
+            pygame.draw.rect(screen, border_color,
+                            store_rect.move(shake_offset[0], shake_offset[1]),
+                            width=4, border_radius=Dimensions.MANCALA_BORDER_RADIUS)
+        
+            # Score with glow effect
+            score = str(mancala[store_id])
+            text_pos = (store_rect.centerx + shake_offset[0], store_rect.centery + shake_offset[1])
+            draw_text_with_glow(screen, fonts.large, score, text_pos, Colors.TEXT_PRIMARY,
+                               glow_color=border_color, glow_intensity=3)
+    
+    with profiler.scope("pits"):
+        # Draw pits with hover effects
+        for pit_id, pos in pit_positions.items():
+            is_player_pit = 0 <= pit_id <= 5
+            is_highlighted = highlight_pit == pit_id
+            is_suggested = suggested_move == pit_id
+            is_hover = hover_pit == pit_id
+            can_play = is_player_pit and mancala[pit_id] > 0
+        
+            pit_pos = (pos[0] + shake_offset[0], pos[1] + shake_offset[1])
+        
+            # Add/update hover effect
+            hover_effect = animation_manager.add_hover_effect(pit_id, pit_pos, Dimensions.PIT_RADIUS)
+            current_radius = hover_effect.get_scaled_radius()
+        
+            # Determine pit color and glow
+            if is_highlighted:
+                pit_color = Colors.PIT_SELECTED
+                glow_color = Colors.NEON_YELLOW
+                glow_intensity = 1.2
+            elif is_suggested:
+                pit_color = Colors.PIT_ACTIVE
+                glow_color = Colors.NEON_ORANGE
+                glow_intensity = 0.8
+            elif is_hover and can_play:
+                pit_color = Colors.PIT_HOVER
+                glow_color = Colors.PLAYER1_PRIMARY
+                glow_intensity = 0.6
+            elif can_play:
+                pit_color = Colors.PIT_ACTIVE
+                glow_color = Colors.PLAYER1_PRIMARY
+                glow_intensity = 0.3
+            else:
+                pit_color = Colors.PIT_INACTIVE
+                glow_color = Colors.PIT_BORDER_INACTIVE
+                glow_intensity = 0.1
+        
+            with profiler.scope("pits.glow"):
+                # Glow effect
+                if glow_intensity > 0.2:
+                    draw_neon_glow(screen, pit_pos, current_radius, glow_color, glow_intensity)
+        
+            with profiler.scope("pits.gradient"):
+                # Pit background with radial gradient
+                draw_radial_gradient(screen, pit_pos, pit_color, Colors.PIT_INACTIVE, current_radius)
+        
+                # Border
+                border_color = glow_color if can_play or is_highlighted else Colors.PIT_BORDER_INACTIVE
+                pygame.draw.circle(screen, border_color, pit_pos, current_radius, width=3)
+        
+            with profiler.scope("pits.shadow"):
+                # Inner shadow
+                shadow_surf = pygame.Surface((current_radius * 3, current_radius * 3), pygame.SRCALPHA)
+                for i in range(5):
+                    alpha = 40 - i * 8
+                    pygame.draw.circle(shadow_surf, (0, 0, 0, alpha),
+                                     (current_radius * 1.5, current_radius * 1.5),
+                                     current_radius - i * 2)
+                screen.blit(shadow_surf, (pit_pos[0] - current_radius * 1.5, 
+                                          pit_pos[1] - current_radius * 1.5))
+        
+            with profiler.scope("pits.text"):
+                # Stone count with glow
+                stone_count = mancala[pit_id]
+                count_color = Colors.TEXT_PRIMARY if stone_count > 0 else Colors.TEXT_SECONDARY
+                draw_text_with_glow(screen, fonts.medium, str(stone_count), pit_pos,
+                                   count_color, glow_color=glow_color if can_play else None,
+                                   glow_intensity=2 if can_play else 0)
+        
+                # Pit number label - FIXED: Inside pit, no overlap
+                label_color = Colors.TEXT_SECONDARY if stone_count == 0 else (*Colors.TEXT_SECONDARY, 180)
+                label = fonts.tiny.render(str(pit_id + 1), True, label_color)
+                # Position label at bottom of pit, inside the circle
+                label_y = pit_pos[1] + current_radius - 15
+                label_rect = label.get_rect(center=(pit_pos[0], label_y))
+                screen.blit(label, label_rect)
+    
+    with profiler.scope("particles"):
+        # Draw animations
+        animation_manager.draw(screen)
+    
+    with profiler.scope("panels"):
+        # Player Win Chance Panel (bottom-left)
+        player_panel_rect = pygame.Rect(20, Dimensions.SCREEN_HEIGHT - 160, 
+                                         Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, player_panel_rect)
+    
+        draw_neon_glow(screen, (player_panel_rect.x + 40, player_panel_rect.y + 30), 15, Colors.PLAYER1_PRIMARY, 0.8)
+        pygame.draw.circle(screen, Colors.PLAYER1_PRIMARY, (player_panel_rect.x + 40, player_panel_rect.y + 30), 15)
+    
+        player_title = fonts.small.render("🎮 Your Win Chance", True, Colors.TEXT_SECONDARY)
+        screen.blit(player_title, (player_panel_rect.x + 70, player_panel_rect.y + 20))
+    
+        draw_text_with_glow(screen, fonts.large, f"{probability:.1f}%",
+                           (player_panel_rect.x + 70, player_panel_rect.y + 65),
+                           Colors.PLAYER1_PRIMARY, glow_color=Colors.PLAYER1_PRIMARY, glow_intensity=2)
+    
+        bar_rect = pygame.Rect(player_panel_rect.x + 25, player_panel_rect.y + 105,
+                              Dimensions.PANEL_WIDTH - 50, 18)
+        draw_progress_bar(screen, bar_rect, probability / 100,
+                         Colors.PLAYER1_PRIMARY, Colors.PLAYER1_SECONDARY)
+    
+        # AI Win Chance Panel (top-left)
+        ai_panel_rect = pygame.Rect(20, 20, Dimensions.PANEL_WIDTH, Dimensions.PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, ai_panel_rect)
+    
+        draw_neon_glow(screen, (ai_panel_rect.x + 40, ai_panel_rect.y + 30), 15, Colors.PLAYER2_PRIMARY, 0.8)
+        pygame.draw.circle(screen, Colors.PLAYER2_PRIMARY, (ai_panel_rect.x + 40, ai_panel_rect.y + 30), 15)
+    
+        ai_title = fonts.small.render("🤖 AI Win Chance", True, Colors.TEXT_SECONDARY)
+        screen.blit(ai_title, (ai_panel_rect.x + 70, ai_panel_rect.y + 20))
+    
+        ai_probability = 100 - probability
+        draw_text_with_glow(screen, fonts.large, f"{ai_probability:.1f}%",
+                           (ai_panel_rect.x + 70, ai_panel_rect.y + 65),
+                           Colors.PLAYER2_PRIMARY, glow_color=Colors.PLAYER2_PRIMARY, glow_intensity=2)
+    
+        bar_rect2 = pygame.Rect(ai_panel_rect.x + 25, ai_panel_rect.y + 105,
+                               Dimensions.PANEL_WIDTH - 50, 18)
+        draw_progress_bar(screen, bar_rect2, ai_probability / 100,
+                         Colors.PLAYER2_PRIMARY, Colors.PLAYER2_SECONDARY)
+    
+        # Move counter panel (top-right)
+        move_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - Dimensions.PANEL_WIDTH - 20, 20,
+                                       Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, move_panel_rect,
+                               bg_color=(*Colors.NEON_BLUE, 40),
+                               border_color=Colors.NEON_BLUE)
+    
+        move_text = f"Move: {move_count}"
+        draw_text_with_glow(screen, fonts.normal, move_text,
+                           (move_panel_rect.centerx, move_panel_rect.centery),
+                           Colors.TEXT_PRIMARY, glow_color=Colors.NEON_BLUE, glow_intensity=2)
+    
+        # ESC button panel (below move counter)
+        esc_panel_rect = pygame.Rect(Dimensions.SCREEN_WIDTH - Dimensions.PANEL_WIDTH - 20,
+                                      move_panel_rect.bottom + 15,
+                                      Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
+        draw_glassmorphic_panel(screen, esc_panel_rect,
+                               bg_color=(*Colors.NEON_PURPLE, 40),
+                               border_color=Colors.GLASS_BORDER)
+    
+        esc_text = fonts.small.render("Press ESC to quit", True, Colors.TEXT_SECONDARY)
+        esc_rect = esc_text.get_rect(center=(esc_panel_rect.centerx, esc_panel_rect.centery))
+        screen.blit(esc_text, esc_rect)
+    
+        # AI Suggestion panel (below player panel if active)
+        if suggested_move is not None:
+            suggest_rect = pygame.Rect(20, player_panel_rect.bottom + 15, 
+                                        Dimensions.PANEL_WIDTH, Dimensions.MINI_PANEL_HEIGHT)
+            draw_glassmorphic_panel(screen, suggest_rect, 
+                                   bg_color=(*Colors.NEON_ORANGE, 60),
+                                   border_color=Colors.NEON_ORANGE)
+        
+            # Lightning icon
+            icon_x = suggest_rect.x + 30
+            icon_y = suggest_rect.centery
+            draw_neon_glow(screen, (icon_x, icon_y), 12, Colors.NEON_YELLOW, 1.0)
+        
+            # Text
+            suggest_title = fonts.small.render("💡 AI Suggestion", True, Colors.TEXT_PRIMARY)
+            screen.blit(suggest_title, (suggest_rect.x + 60, suggest_rect.y + 20))
+        
+            suggest_text = f"Play Pit {suggested_move + 1}"
+            draw_text_with_glow(screen, fonts.normal, suggest_text,
+                               (suggest_rect.x + 60, suggest_rect.y + 50),
+                               Colors.NEON_YELLOW, glow_color=Colors.NEON_ORANGE,
+                               glow_intensity=2)
+    
+    with profiler.scope("turn_indicator"):
+        # Turn indicator
+        animation_manager.draw_turn_indicator(screen, fonts.large)
+    
+    with profiler.scope("hud"):
+        profiler.draw_hud(screen, fonts.tiny)
+    
+    with profiler.scope("flip"):
+        pygame.display.flip()
+    profiler.end_frame()
 
 
 def game_over_popup(message, player_score, ai_score):
@@ -423,6 +445,8 @@ def game_over_popup(message, player_score, ai_score):
 
 
 class Mancala_Board:
+    __slots__ = ('mancala',)
+
     def __init__(self, mancala):
         if mancala is not None:
             self.mancala = mancala[:]
@@ -560,8 +584,20 @@ class Mancala_Board:
             return True
         return False
 
-    def husVal(self):
-        if self.isEnd():
+    def isDecided(self):
+        """One store holds more than half of all stones, so its owner has won"""
+        return 2 * max(self.mancala[6], self.mancala[13]) > sum(self.mancala)
+
+    def resolve(self):
+        """End a decided game now: each side's stones go to its own store"""
+        self.mancala[6] += sum(self.mancala[0:6])
+        self.mancala[13] += sum(self.mancala[7:13])
+        for i in range(14):
+            if i != 13 and i != 6:
+                self.mancala[i] = 0
+
+    def husVal(self, decided=False):
+        if self.isEnd() or (decided and self.isDecided()):
             if self.mancala[13] > self.mancala[6]:
                 return 100
             elif self.mancala[13] == self.mancala[6]:
@@ -572,9 +608,15 @@ class Mancala_Board:
             return self.mancala[13] - self.mancala[6]
 
 
-def alphabeta(mancala, depth, alpha, beta, MinorMax):
-    if depth == 0 or mancala.isEnd():
-        return mancala.husVal(), -1
+def alphabeta(mancala, depth, alpha, beta, MinorMax, budget=None, stop_decided=False):
+    """
+    Alpha-beta minimax; a mancala_core.SearchBudget aborts the search once spent.
+    With stop_decided decided positions are not searched further.
+    """
+    if budget is not None:
+        budget.tick()
+    if depth == 0 or mancala.isEnd() or (stop_decided and mancala.isDecided()):
+        return mancala.husVal(stop_decided), -1
     if MinorMax:
         v = -1000000
         player_move = -1
@@ -582,7 +624,7 @@ def alphabeta(mancala, depth, alpha, beta, MinorMax):
             if mancala.mancala[i] == 0: continue
             a = Mancala_Board(mancala.mancala[:])
             minormax = a.player_move(i)
-            newv, _ = alphabeta(a, depth - 1, alpha, beta, minormax)
+            newv, _ = alphabeta(a, depth - 1, alpha, beta, minormax, budget, stop_decided)
             if v < newv:
                 player_move = i
                 v = newv
@@ -597,7 +639,7 @@ def alphabeta(mancala, depth, alpha, beta, MinorMax):
             if mancala.mancala[i] == 0: continue
             a = Mancala_Board(mancala.mancala[:])
             minormax = a.player_move(i)
-            newv, _ = alphabeta(a, depth - 1, alpha, beta, not minormax)
+            newv, _ = alphabeta(a, depth - 1, alpha, beta, not minormax, budget, stop_decided)
             if v > newv:
                 player_move = i
                 v = newv
@@ -607,48 +649,163 @@ def alphabeta(mancala, depth, alpha, beta, MinorMax):
         return v, player_move
 
 
-def genetic_algorithm(mancala_board, population_size=50, generations=20, mutation_rate=0.1):
-    def initialize_population(size, num_pits):
-        return [random.sample(range(6), num_pits) for _ in range(size)]
+# ==================== BATCHED GA SIMULATION ====================
+
+# South sows around a 13-slot cycle (pits 0-5, store 6, pits 7-12) and skips 13
+SOUTH_CYCLE = np.arange(13)
+
+# Every 3-move sequence over South's pits, indexed by m0 * 36 + m1 * 6 + m2
+SEQUENCE_LENGTH = 3
+ALL_SEQUENCES = np.array(np.meshgrid(*[np.arange(6)] * SEQUENCE_LENGTH, indexing='ij')
+                         ).reshape(SEQUENCE_LENGTH, -1).T
+SEQUENCE_WEIGHTS = 6 ** np.arange(SEQUENCE_LENGTH - 1, -1, -1)
+
+
+def batch_player_move(boards, moves):
+    """
+    Apply Mancala_Board.player_move for South to every row of a
+    (population, 14) board array in place, one move index per row.
+    Rows whose pit is empty are left unchanged.
+    Returns the repeat-turn flags.
+    """
+    rows = np.arange(len(boards))
+    seeds = boards[rows, moves]
+    boards[rows, moves] = 0
     
-    def fitness(individual, mancala_board):
-        board_copy = Mancala_Board(mancala_board.mancala[:])
-        total_stones = 0
-        for move in individual:
-            if board_copy.mancala[move] > 0:
-                board_copy.player_move(move)
-                total_stones += board_copy.mancala[6]
-        return total_stones
+    # Cell c receives one seed for each k in 1..seeds with (move + k) % 13 == c
+    distance = (SOUTH_CYCLE[None, :] - moves[:, None]) % 13
+    distance[distance == 0] = 13
+    boards[:, :13] += np.maximum(0, (seeds[:, None] - distance) // 13 + 1)
     
-    def crossover(parent1, parent2):
-        crossover_point = random.randint(1, len(parent1) - 1)
-        return parent1[:crossover_point] + parent2[crossover_point:]
+    last = (moves + seeds) % 13
+    played = seeds > 0
+    own_side = played & (last < 6)
+    opposite = 12 - last
+    capture = own_side & (boards[rows, last] == 1) & (boards[rows, opposite] != 0)
     
-    def mutate(individual, mutation_rate):
-        for i in range(len(individual)):
-            if random.random() < mutation_rate:
-                individual[i] = random.randint(0, 5)
-        return individual
+    captured_rows = rows[capture]
+    boards[captured_rows, 6] += 1 + boards[captured_rows, opposite[capture]]
+    boards[captured_rows, last[capture]] = 0
+    boards[captured_rows, opposite[capture]] = 0
+    return played & (last == 6)
+
+
+def population_fitness(mancala, population):
+    """
+    Score every move sequence of a (population, length) array in one pass.
+    Same measure as replaying each individual on its own board: the South
+    store summed after every move that could be played.
+    """
+    boards = np.tile(np.asarray(mancala, dtype=np.int64), (len(population), 1))
+    rows = np.arange(len(population))
+    total = np.zeros(len(population), dtype=np.int64)
+    for step in range(population.shape[1]):
+        moves = population[:, step]
+        played = boards[rows, moves] > 0
+        batch_player_move(boards, moves)
+        total += np.where(played, boards[:, 6], 0)
+    return total
+
+
+def genetic_algorithm(mancala_board, population_size=500, generations=50, mutation_rate=0.1,
+                      cancel_event=None):
+    """
+    Evolve 3-move sequences for South and return the first move of the best.
+    The whole population is held as one array. There are only 6 ** 3
+    distinct individuals, so all of them are scored in a single
+    population_fitness pass and each generation is a table lookup.
+    Returns None when cancel_event is set before the search finishes.
+    """
+    rng = np.random.default_rng(random.getrandbits(32))
+    elite_size = population_size // 2
+    child_count = population_size - elite_size
+    sequence_scores = population_fitness(mancala_board.mancala, ALL_SEQUENCES)
     
-    population = initialize_population(population_size, 3)
+    # Distinct pits per individual, like random.sample(range(6), 3)
+    population = np.argsort(rng.random((population_size, 6)), axis=1)[:, :SEQUENCE_LENGTH]
     
     for _ in range(generations):
-        population = sorted(population, key=lambda x: fitness(x, mancala_board), reverse=True)
-        new_population = population[:population_size // 2]
+        if cancel_event is not None and cancel_event.is_set():
+            return None
+        scores = sequence_scores[population @ SEQUENCE_WEIGHTS]
+        elite = population[np.argsort(-scores, kind='stable')[:elite_size]]
+        
+        # Crossover between two distinct elite parents
+        parent1 = rng.integers(0, elite_size, child_count)
+        parent2 = (parent1 + rng.integers(1, elite_size, child_count)) % elite_size
+        crossover_point = rng.integers(1, population.shape[1], child_count)
+        from_first = np.arange(population.shape[1])[None, :] < crossover_point[:, None]
+        children = np.where(from_first, elite[parent1], elite[parent2])
         
-        while len(new_population) < population_size:
-            parent1, parent2 = random.sample(population[:population_size // 2], 2)
-            child = crossover(parent1, parent2)
-            child = mutate(child, mutation_rate)
-            new_population.append(child)
+        # Mutation
+        mutated = rng.random(children.shape) < mutation_rate
+        children[mutated] = rng.integers(0, 6, int(mutated.sum()))
         
-        population = new_population
+        population = np.concatenate([elite, children])
     
-    best_sequence = max(population, key=lambda x: fitness(x, mancala_board))
-    return best_sequence[0]
+    scores = sequence_scores[population @ SEQUENCE_WEIGHTS]
+    return int(population[np.argmax(scores)][0])
 
 
-def player_aibot():
+class HintWorker:
+    """
+    Computes the suggested move on a background thread so the player's turn
+    never waits for the genetic algorithm. A hint is only published for the
+    position it was computed from; requesting a new position or calling
+    cancel() abandons the running search.
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.position = None
+        self.result = None
+        self.cancel_event = None
+    
+    def request(self, mancala):
+        """Start computing a hint for the given board"""
+        self.cancel()
+        position = tuple(mancala)
+        cancel_event = threading.Event()
+        with self.lock:
+            self.position = position
+            self.result = None
+            self.cancel_event = cancel_event
+        
+        def run():
+            move = genetic_algorithm(Mancala_Board(list(position)), cancel_event=cancel_event)
+            with self.lock:
+                if not cancel_event.is_set() and self.position == position:
+                    self.result = (position, move)
+        
+        threading.Thread(target=run, name="hint-worker", daemon=True).start()
+    
+    def get(self, mancala):
+        """Return the hint for this board if ready, starting a search if needed"""
+        position = tuple(mancala)
+        with self.lock:
+            if self.result is not None and self.result[0] == position:
+                return self.result[1]
+            pending = self.position == position
+        if not pending:
+            self.request(mancala)
+        return None
+    
+    def cancel(self):
+        """Abandon the running search, if any"""
+        with self.lock:
+            if self.cancel_event is not None:
+                self.cancel_event.set()
+            self.cancel_event = None
+            self.position = None
+            self.result = None
+
+
+def player_aibot(difficulty=DEFAULT_DIFFICULTY, resolve_decided=False):
+    """
+    The AI searches under the node and time budget of a DIFFICULTY_LEVELS level.
+    With resolve_decided the game ends as soon as its winner is known and the
+    AI stops searching at decided positions.
+    """
+    max_depth, budget = difficulty_budget(difficulty)
     mancala_board = Mancala_Board(None)
     animation_manager = AnimationManager((Dimensions.SCREEN_WIDTH, Dimensions.SCREEN_HEIGHT))
     
@@ -656,9 +813,11 @@ def player_aibot():
     player_turn = True
     selected_pit = -1
     suggested_move = None
+    hint_worker = HintWorker()
     hover_pit = None
     phase = 0
     move_count = 0  # Track move counter
+    decided_shown = False
     
     animation_manager.start_transition(fade_in=True)
     animation_manager.show_turn_indicator("Your Turn", Colors.PLAYER1_PRIMARY)
@@ -698,6 +857,8 @@ def player_aibot():
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
+                if event.key == profiler.toggle_key:
+                    continue  # Handled by the profiler in draw_board
                 if event.key == pygame.K_ESCAPE:
                     running = False
                     pygame.quit()
@@ -711,10 +872,11 @@ def player_aibot():
                     animation_manager.emit_fountain(*pit_positions[selected_pit], count=40)
         
         if player_turn and suggested_move is None:
-            suggested_move = genetic_algorithm(mancala_board)
+            suggested_move = hint_worker.get(mancala_board.mancala)
         
         if selected_pit != -1 and player_turn:
             move_count += 1  # Increment move counter
+            hint_worker.cancel()
             
             # Show selected pit for 1 second
             pre_move_start = time.time()
@@ -774,10 +936,17 @@ def player_aibot():
             
             player_turn = repeat_turn
             selected_pit = -1
+            # The old hint belongs to the previous position
+            suggested_move = None
             if not repeat_turn:
-                suggested_move = None
                 hover_pit = None
         
+        if not decided_shown and not mancala_board.isEnd() and mancala_board.isDecided():
+            decided_shown = True
+            animation_manager.show_turn_indicator("Game Decided!", Colors.NEON_GREEN)
+            if resolve_decided:
+                mancala_board.resolve()
+
         if not player_turn and not mancala_board.isEnd():
             # Show "AI Thinking..." for 1 second
             animation_manager.show_turn_indicator("AI Thinking...", Colors.PLAYER2_PRIMARY)
@@ -794,7 +963,9 @@ def player_aibot():
                          probability=probability, phase=phase, move_count=move_count)
                 clock.tick(60)
             
-            _, ai_move = alphabeta(mancala_board, 5, -100000, 100000, True)
+            _, ai_move, _ = search_with_budget(
+                lambda depth, b: alphabeta(mancala_board, depth, -100000, 100000, True, b, resolve_decided),
+                max_depth, budget)
             if ai_move != -1:
                 move_count += 1  # Increment move counter for AI
                 
@@ -862,6 +1033,7 @@ def player_aibot():
         phase += 0.5
         
         if mancala_board.isEnd():
+            hint_worker.cancel()
             player_score = mancala_board.mancala[6]
             ai_score = mancala_board.mancala[13]
             
@@ -895,7 +1067,7 @@ def player_aibot():
                         if event.key == pygame.K_SPACE:
                             waiting = False
                             # Restart the game by calling the function recursively
-                            player_aibot()
+                            player_aibot(difficulty, resolve_decided)
                             return  # Exit current game instance
                         elif event.key == pygame.K_ESCAPE:
                             pygame.quit()
@@ -954,8 +1126,13 @@ def splash_screen():
 
 # Start game directly without splash screen loop
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Mancala AI vs Player')
+    parser.add_argument('--difficulty', choices=list(DIFFICULTY_LEVELS), default=DEFAULT_DIFFICULTY)
+    parser.add_argument('--resolve-decided', action='store_true',
+                        help='end the game as soon as one store holds a majority of the stones')
+    args = parser.parse_args()
     try:
-        player_aibot()
+        player_aibot(args.difficulty, args.resolve_decided)
     except Exception as e:
         print(f"Error running AI vs Player: {e}")
         import traceback
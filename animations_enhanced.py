@@ -5,6 +5,7 @@ import pygame
 import random
 import math
 from ui_config_enhanced import Colors, Dimensions, AnimationConfig, ease_out_cubic, ease_in_out_cubic
+from profiler_enhanced import profiler
 
 
 class EnhancedParticle:
@@ -401,25 +402,33 @@ class AnimationManager:
     
     def update(self):
         """Update all animations"""
-        self.particles.update()
-        
-        for glow in self.glows:
-            glow.update()
-        
-        for hover in self.hover_effects.values():
-            hover.update()
-        
-        for counter in self.score_counters.values():
-            counter.update()
-        
-        if self.shake:
-            if not self.shake.update():
-                self.shake = None
-        
-        if self.transition:
-            self.transition.update()
-        
-        self.turn_indicator.update()
+        with profiler.scope("anim"):
+            with profiler.scope("anim.particles"):
+                self.particles.update()
+            
+            with profiler.scope("anim.glows"):
+                for glow in self.glows:
+                    glow.update()
+            
+            with profiler.scope("anim.hover"):
+                for hover in self.hover_effects.values():
+                    hover.update()
+            
+            with profiler.scope("anim.counters"):
+                for counter in self.score_counters.values():
+                    counter.update()
+            
+            with profiler.scope("anim.shake"):
+                if self.shake:
+                    if not self.shake.update():
+                        self.shake = None
+            
+            with profiler.scope("anim.transition"):
+                if self.transition:
+                    self.transition.update()
+            
+            with profiler.scope("anim.turn_indicator"):
+                self.turn_indicator.update()
     
     def draw(self, surface):
         """Draw all animations"""
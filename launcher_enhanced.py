@@ -9,7 +9,9 @@ import pygame
 from ui_config_enhanced import (Colors, Dimensions, fonts, draw_gradient_rect,
                                  draw_triple_gradient_rect, draw_neon_glow,
                                  draw_glassmorphic_panel, draw_text_with_glow,
-                                 draw_radial_gradient, draw_animated_border)
+                                 draw_radial_gradient, draw_animated_border,
+                                 SurfaceCache)
+from mancala_core import DIFFICULTY_LEVELS, DEFAULT_DIFFICULTY
 
 pygame.init()
 
@@ -53,6 +55,19 @@ for i in range(len(CARDS)):
     y = start_y
     card_rects.append(pygame.Rect(x, y, CARD_WIDTH, CARD_HEIGHT))
 
+# AI difficulty selector - passed to the game as --difficulty
+DIFFICULTIES = list(DIFFICULTY_LEVELS)
+PILL_WIDTH = 150
+PILL_HEIGHT = 46
+PILL_SPACING = 20
+pill_x = (WINDOW_SIZE[0] - (PILL_WIDTH * len(DIFFICULTIES) + PILL_SPACING * (len(DIFFICULTIES) - 1))) // 2
+pill_y = start_y + CARD_HEIGHT + 60
+
+difficulty_rects = []
+for i in range(len(DIFFICULTIES)):
+    difficulty_rects.append(pygame.Rect(pill_x + i * (PILL_WIDTH + PILL_SPACING), pill_y,
+                                        PILL_WIDTH, PILL_HEIGHT))
+
 
 def draw_animated_background(phase):
     """Draw animated gradient background"""
@@ -71,10 +86,73 @@ def draw_animated_background(phase):
                            (*colors[i], 25), (*colors[i], 0), int(radius))
 
 
+# Pre-rendered card textures, keyed per card and hover state
+card_cache = SurfaceCache()
+
+
+def render_card_shadow(size, alpha):
+    """Render one card shadow layer"""
+    shadow_surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(shadow_surf, (0, 0, 0, alpha), (0, 0, size[0], size[1]),
+                    border_radius=30)
+    return shadow_surf
+
+
+def render_card_body(size, card_info, hover):
+    """Render the static part of a card: background, borders and text"""
+    color1 = card_info["color1"]
+    width, height = size
+    centerx = width // 2
+    
+    # Card background with glassmorphism
+    card_surf = pygame.Surface(size, pygame.SRCALPHA)
+    
+    # Gradient background
+    draw_gradient_rect(card_surf, Colors.BG_DARK_PRIMARY, Colors.BG_DARK_SECONDARY,
+                      pygame.Rect(0, 0, width, height),
+                      vertical=True, border_radius=30)
+    
+    # Glass overlay
+    glass_surf = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(glass_surf, Colors.GLASS_WHITE, (0, 0, width, height),
+                    border_radius=30)
+    card_surf.blit(glass_surf, (0, 0))
+    
+    # Borders land opaque on the display surface, so bake them in opaque.
+    # The hover border is animated and drawn per frame by draw_card.
+    border_color = Colors.GLASS_BORDER[:3]
+    if not hover:
+        pygame.draw.rect(card_surf, (*border_color, 255), (0, 0, width, height),
+                        width=3, border_radius=30)
+    
+    # Inner highlight
+    pygame.draw.rect(card_surf, (*border_color, 255), (4, 4, width - 8, height - 8),
+                    width=2, border_radius=27)
+    
+    # The card interior is opaque, so text blended here matches the screen
+    # Title
+    if hover:
+        draw_text_with_glow(card_surf, fonts.normal, card_info["label"], (centerx, 120),
+                           Colors.TEXT_PRIMARY, glow_color=color1, glow_intensity=2)
+    else:
+        title_text = fonts.normal.render(card_info["label"], True, Colors.TEXT_PRIMARY)
+        card_surf.blit(title_text, title_text.get_rect(center=(centerx, 120)))
+    
+    # Subtitle
+    subtitle_color = color1 if hover else Colors.TEXT_SECONDARY
+    subtitle_text = fonts.small.render(card_info["subtitle"], True, subtitle_color)
+    card_surf.blit(subtitle_text, subtitle_text.get_rect(center=(centerx, 160)))
+    
+    # Description
+    desc_text = fonts.tiny.render(card_info["description"], True, Colors.TEXT_SECONDARY)
+    card_surf.blit(desc_text, desc_text.get_rect(center=(centerx, 195)))
+    return card_surf
+
+
 def draw_card(rect, card_info, hover, pressed=False, phase=0):
     """Draw a glassmorphic game mode card"""
     color1 = card_info["color1"]
-    color2 = card_info["color2"]
+    label = card_info["label"]
     
     # Hover effect - lift card
     offset_y = -10 if hover else 0
@@ -82,6 +160,7 @@ def draw_card(rect, card_info, hover, pressed=False, phase=0):
         offset_y = 5
     
     current_rect = rect.move(0, offset_y)
+    size = current_rect.size
     
     # Outer glow
     if hover:
@@ -91,44 +170,18 @@ def draw_card(rect, card_info, hover, pressed=False, phase=0):
     for i in range(3):
         shadow_offset = (5 - offset_y) + i * 3
         shadow_alpha = 60 - i * 15
-        shadow_rect = current_rect.move(shadow_offset, shadow_offset)
-        shadow_surf = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, (0, 0, 0, shadow_alpha),
-                        (0, 0, shadow_rect.width, shadow_rect.height),
-                        border_radius=30)
-        screen.blit(shadow_surf, shadow_rect.topleft)
-    
-    # Card background with glassmorphism
-    card_surf = pygame.Surface((current_rect.width, current_rect.height), pygame.SRCALPHA)
-    
-    # Gradient background
-    draw_gradient_rect(card_surf, Colors.BG_DARK_PRIMARY, Colors.BG_DARK_SECONDARY,
-                      pygame.Rect(0, 0, current_rect.width, current_rect.height),
-                      vertical=True, border_radius=30)
-    
-    # Glass overlay
-    glass_surf = pygame.Surface((current_rect.width, current_rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(glass_surf, Colors.GLASS_WHITE,
-                    (0, 0, current_rect.width, current_rect.height),
-                    border_radius=30)
-    card_surf.blit(glass_surf, (0, 0))
+        shadow_surf = card_cache.get(('shadow', size, shadow_alpha),
+                                     lambda: render_card_shadow(size, shadow_alpha))
+        screen.blit(shadow_surf, current_rect.move(shadow_offset, shadow_offset).topleft)
     
+    # Card background, static borders and text
+    card_surf = card_cache.get(('body', label, size, hover),
+                               lambda: render_card_body(size, card_info, hover))
     screen.blit(card_surf, current_rect.topleft)
     
-    # Animated border - FIXED
+    # Animated border
     if hover:
         draw_animated_border(screen, current_rect, color1, phase, width=4, border_radius=30)
-    else:
-        # FIX: Extract RGB values only
-        border_color = Colors.GLASS_BORDER[:3] if len(Colors.GLASS_BORDER) > 3 else Colors.GLASS_BORDER
-        pygame.draw.rect(screen, (*border_color, 150), current_rect,
-                        width=3, border_radius=30)
-    
-    # Inner highlight - FIXED
-    inner_rect = current_rect.inflate(-8, -8)
-    highlight_color = Colors.GLASS_BORDER[:3] if len(Colors.GLASS_BORDER) > 3 else Colors.GLASS_BORDER
-    pygame.draw.rect(screen, (*highlight_color, 80), inner_rect,
-                    width=2, border_radius=27)
     
     # Icon with glow
     icon_y = current_rect.y + 50
@@ -137,38 +190,16 @@ def draw_card(rect, card_info, hover, pressed=False, phase=0):
     if hover:
         draw_neon_glow(screen, (current_rect.centerx, icon_y), icon_size // 2, color1, 0.6)
     
-    icon_text = fonts.large.render(card_info["icon"], True, color1)
+    icon_text = card_cache.get(('icon', label),
+                               lambda: fonts.large.render(card_info["icon"], True, color1))
     icon_rect = icon_text.get_rect(center=(current_rect.centerx, icon_y))
     screen.blit(icon_text, icon_rect)
     
-    # Title
-    title_y = current_rect.y + 120
-    if hover:
-        draw_text_with_glow(screen, fonts.normal, card_info["label"],
-                           (current_rect.centerx, title_y),
-                           Colors.TEXT_PRIMARY, glow_color=color1, glow_intensity=2)
-    else:
-        title_text = fonts.normal.render(card_info["label"], True, Colors.TEXT_PRIMARY)
-        title_rect = title_text.get_rect(center=(current_rect.centerx, title_y))
-        screen.blit(title_text, title_rect)
-    
-    # Subtitle
-    subtitle_y = current_rect.y + 160
-    subtitle_color = color1 if hover else Colors.TEXT_SECONDARY
-    subtitle_text = fonts.small.render(card_info["subtitle"], True, subtitle_color)
-    subtitle_rect = subtitle_text.get_rect(center=(current_rect.centerx, subtitle_y))
-    screen.blit(subtitle_text, subtitle_rect)
-    
-    # Description
-    desc_y = current_rect.y + 195
-    desc_text = fonts.tiny.render(card_info["description"], True, Colors.TEXT_SECONDARY)
-    desc_rect = desc_text.get_rect(center=(current_rect.centerx, desc_y))
-    screen.blit(desc_text, desc_rect)
-    
     # Hover indicator
     if hover:
         indicator_y = current_rect.y + CARD_HEIGHT - 25
-        indicator_text = fonts.tiny.render("▶ Click to play", True, color1)
+        indicator_text = card_cache.get(('indicator', label),
+                                        lambda: fonts.tiny.render("▶ Click to play", True, color1))
         indicator_rect = indicator_text.get_rect(center=(current_rect.centerx, indicator_y))
         
         # Pulsing effect
@@ -201,6 +232,24 @@ def draw_title(phase):
                        glow_intensity=2)
 
 
+def draw_difficulty(selected_idx, hover_idx):
+    """Draw the AI difficulty pills, highlighting the selected level"""
+    label = fonts.small.render("AI Difficulty", True, Colors.TEXT_SECONDARY)
+    screen.blit(label, label.get_rect(center=(WINDOW_SIZE[0] // 2, pill_y - 22)))
+    
+    for i, (name, rect) in enumerate(zip(DIFFICULTIES, difficulty_rects)):
+        selected = (i == selected_idx)
+        border = Colors.NEON_BLUE if selected else Colors.GLASS_BORDER
+        if selected:
+            draw_neon_glow(screen, rect.center, PILL_WIDTH // 2, Colors.NEON_BLUE, 0.4, layers=4)
+        draw_glassmorphic_panel(screen, rect,
+                               bg_color=(*Colors.BG_DARK_PRIMARY, 200 if selected or i == hover_idx else 150),
+                               border_color=border)
+        color = Colors.TEXT_PRIMARY if selected else Colors.TEXT_SECONDARY
+        text = fonts.small.render(name.capitalize(), True, color)
+        screen.blit(text, text.get_rect(center=rect.center))
+
+
 def draw_footer():
     """Draw footer with instructions"""
     footer_y = WINDOW_SIZE[1] - 60
@@ -210,7 +259,7 @@ def draw_footer():
                            bg_color=(*Colors.BG_DARK_PRIMARY, 150),
                            border_color=Colors.GLASS_BORDER)
     
-    footer_text = fonts.small.render("Press ESC to quit", True, Colors.TEXT_SECONDARY)
+    footer_text = fonts.small.render("Arrow keys: difficulty  ·  ESC to quit", True, Colors.TEXT_SECONDARY)
     footer_rect = footer_text.get_rect(center=(WINDOW_SIZE[0] // 2, footer_y))
     screen.blit(footer_text, footer_rect)
 
@@ -258,8 +307,8 @@ def show_message(lines, duration=2.0, phase=0):
     pygame.time.wait(int(duration * 1000))
 
 
-def launch_game(game_file):
-    """Launch the selected game"""
+def launch_game(game_file, difficulty=DEFAULT_DIFFICULTY):
+    """Launch the selected game at the selected AI difficulty"""
     script_path = os.path.join(os.path.dirname(__file__), game_file)
     
     if not os.path.exists(script_path):
@@ -272,7 +321,7 @@ def launch_game(game_file):
         return
     
     try:
-        subprocess.call([sys.executable, script_path])
+        subprocess.call([sys.executable, script_path, '--difficulty', difficulty])
     except Exception as e:
         show_message([
             "❌ Launch Failed!",
@@ -286,6 +335,8 @@ def main():
     """Main launcher loop"""
     hover_idx = None
     pressed_idx = None
+    difficulty_idx = DIFFICULTIES.index(DEFAULT_DIFFICULTY)
+    difficulty_hover = None
     phase = 0
     running = True
     
@@ -297,6 +348,10 @@ def main():
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     running = False
+                elif event.key == pygame.K_LEFT:
+                    difficulty_idx = max(0, difficulty_idx - 1)
+                elif event.key == pygame.K_RIGHT:
+                    difficulty_idx = min(len(DIFFICULTIES) - 1, difficulty_idx + 1)
             
             elif event.type == pygame.MOUSEMOTION:
                 mx, my = event.pos
@@ -305,6 +360,11 @@ def main():
                     if rect.collidepoint(mx, my):
                         hover_idx = i
                         break
+                difficulty_hover = None
+                for i, rect in enumerate(difficulty_rects):
+                    if rect.collidepoint(mx, my):
+                        difficulty_hover = i
+                        break
             
             elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 mx, my = event.pos
@@ -312,12 +372,16 @@ def main():
                     if rect.collidepoint(mx, my):
                         pressed_idx = i
                         break
+                for i, rect in enumerate(difficulty_rects):
+                    if rect.collidepoint(mx, my):
+                        difficulty_idx = i
+                        break
             
             elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
                 if pressed_idx is not None:
                     mx, my = event.pos
                     if card_rects[pressed_idx].collidepoint(mx, my):
-                        launch_game(CARDS[pressed_idx]["file"])
+                        launch_game(CARDS[pressed_idx]["file"], DIFFICULTIES[difficulty_idx])
                     pressed_idx = None
         
         # Draw everything
@@ -329,6 +393,7 @@ def main():
             is_pressed = (pressed_idx == i)
             draw_card(rect, card_info, is_hover, is_pressed, phase)
         
+        draw_difficulty(difficulty_idx, difficulty_hover)
         draw_footer()
         
         pygame.display.flip()
@@ -0,0 +1,252 @@
+"""
+Endgame database for the core Mancala rules: file format, builder and reader.
+
+Positions are the twelve pits and the side to move; stores do not matter (see
+mancala_solver.py), so the stored value is the future net store gain
+    G = final (North store - South store) - current store difference
+under perfect play. Only positions with South to move are stored: North to move
+is the mirror image (see mancala_core.canonical) with G negated. Positions with
+n seeds on the board are ranked to dense
+integers 0 .. C(n + 11, 11) - 1 by stars-and-bars (the lexicographic rank of
+the 12-part composition of n) and kept in one file per seed total:
+
+    offset  size  field
+    0       8     magic b'MNCLEGDB'
+    8       4     format version (u4, little endian)
+    12      4     seed total n (u4)
+    16      4     pits (u4, always 12)
+    20      8     positions C(n + 11, 11) (u8)
+    28      36    zero padding
+    64      ...   int8 values, one per rank (South to move)
+
+Files are opened with numpy.memmap the first time a seed total is probed, so
+opening a database costs nothing whatever its size and a probe is a rank
+computation plus one array read.
+
+Usage:
+    python mancala_endgame_db.py build --max-seeds 8    # write endgame/kalah_nXX.db
+    python mancala_endgame_db.py info                   # list the files
+"""
+import os
+import sys
+import time
+import argparse
+from math import comb
+
+import numpy as np
+
+from mancala_core import Mancala, register_probe
+
+DB_MAGIC = b'MNCLEGDB'
+DB_VERSION = 2
+HEADER_SIZE = 64
+PITS = 12
+MAX_SEEDS = 48
+UNKNOWN = -128
+DEFAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'endgame')
+
+
+# ==================== RANKING ====================
+
+def positions(seeds):
+    """Number of ways to spread 'seeds' over the twelve pits"""
+    return comb(seeds + PITS - 1, PITS - 1)
+
+
+# SKIP[k][r][v]: compositions skipped by putting v seeds in the first of k
+# remaining pits with r seeds left, i.e. the sum over u < v of positions of
+# r - u seeds in k - 1 pits
+SKIP = [[[sum(comb(r - u + k - 2, k - 2) for u in range(v)) for v in range(r + 1)]
+         for r in range(MAX_SEEDS + 1)] if k >= 2 else []
+        for k in range(PITS + 1)]
+
+
+def rank(pits):
+    """Dense index of a 12-pit composition among those with the same seed total"""
+    r = sum(pits)
+    index = 0
+    for i in range(PITS - 1):
+        v = pits[i]
+        index += SKIP[PITS - i][r][v]
+        r -= v
+    return index
+
+
+def compositions(seeds, parts=PITS):
+    """All compositions of 'seeds' into 'parts' pits, in rank order"""
+    if parts == 1:
+        yield (seeds,)
+        return
+    for v in range(seeds + 1):
+        for rest in compositions(seeds - v, parts - 1):
+            yield (v,) + rest
+
+
+def db_path(directory, seeds):
+    return os.path.join(directory, f'kalah_n{seeds:02d}.db')
+
+
+# ==================== FILE FORMAT ====================
+
+def write_table(path, seeds, values):
+    """Write a table of int8 values, one per rank, with its header"""
+    header = (DB_MAGIC + np.array([DB_VERSION, seeds, PITS], dtype='<u4').tobytes()
+              + np.array([len(values)], dtype='<u8').tobytes())
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(header.ljust(HEADER_SIZE, b'\0'))
+        f.write(np.ascontiguousarray(values, dtype=np.int8).tobytes())
+    os.replace(tmp, path)
+
+
+def open_table(path):
+    """Memory-map a table file after checking its header; returns (seeds, values)"""
+    with open(path, 'rb') as f:
+        header = f.read(HEADER_SIZE)
+    if len(header) < HEADER_SIZE or header[:8] != DB_MAGIC:
+        raise ValueError(f"{path} is not an endgame database file")
+    version, seeds, pits = np.frombuffer(header[8:20], dtype='<u4')
+    count = int(np.frombuffer(header[20:28], dtype='<u8')[0])
+    if version != DB_VERSION:
+        raise ValueError(f"{path} has format version {version}, expected {DB_VERSION}")
+    if pits != PITS or count != positions(int(seeds)):
+        raise ValueError(f"{path} has a corrupt header")
+    return int(seeds), np.memmap(path, dtype=np.int8, mode='r', offset=HEADER_SIZE, shape=(count,))
+
+
+# ==================== READER ====================
+
+class EndgameDB:
+    """
+    Read-only view of the database files in a directory. Tables are mapped
+    lazily on first use; seed totals without a file are reported as missing.
+    """
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = directory
+        self.tables = {}
+        self.max_seeds = -1
+        if os.path.isdir(directory):
+            for seeds in range(MAX_SEEDS + 1):
+                if not os.path.exists(db_path(directory, seeds)):
+                    break
+                self.max_seeds = seeds
+        self.probes = 0
+        self.hits = 0
+
+    def table(self, seeds):
+        values = self.tables.get(seeds)
+        if values is None:
+            _, values = open_table(db_path(self.directory, seeds))
+            self.tables[seeds] = values
+        return values
+
+    def probe_pits(self, pits, north_to_move):
+        """G for twelve pits and the side to move, or None"""
+        self.probes += 1
+        seeds = sum(pits)
+        if seeds > self.max_seeds:
+            return None
+        if north_to_move:
+            pits = tuple(pits[6:12]) + tuple(pits[0:6])
+        value = int(self.table(seeds)[rank(pits)])
+        if value == UNKNOWN:
+            return None
+        self.hits += 1
+        return -value if north_to_move else value
+
+    def probe(self, state, north_to_move):
+        """Exact final store difference (North - South), the mancala_core probe signature"""
+        a = state.a
+        gain = self.probe_pits(tuple(a[0:6]) + tuple(a[7:13]), north_to_move)
+        if gain is None:
+            return None
+        return a[Mancala.NORTH_STORE] - a[Mancala.SOUTH_STORE] + gain
+
+    def register(self):
+        """Make alphabeta/pvs use this database"""
+        register_probe(self.probe)
+        return self
+
+
+# ==================== BUILDER ====================
+
+def build_table(seeds, lower):
+    """
+    Values of every position with 'seeds' seeds on the board and South to move.
+    Moves either keep the seed total (filled in recursively, the game graph has no
+    cycles) or lower it (looked up in 'lower', the tables of smaller totals).
+    """
+    values = np.full(positions(seeds), UNKNOWN, dtype=np.int8)
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    def gain(pits, north_to_move):
+        south, north = sum(pits[0:6]), sum(pits[6:12])
+        if south == 0:
+            return north
+        if north == 0:
+            return -south
+        if north_to_move:
+            return -gain(pits[6:12] + pits[0:6], False)
+        total = south + north
+        table = values if total == seeds else lower[total]
+        cached = int(table[rank(pits)])
+        if cached != UNKNOWN:
+            return cached
+        state = Mancala(pits[0:6] + (0,) + pits[6:12] + (0,))
+        best = None
+        for m in state.legal_moves(False):
+            child = state.copy()
+            repeat = child.move(m, None, False)
+            a = child.a
+            value = (a[Mancala.NORTH_STORE] - a[Mancala.SOUTH_STORE]
+                     + gain(tuple(a[0:6]) + tuple(a[7:13]), not repeat))
+            if best is None or value < best:
+                best = value
+        table[rank(pits)] = best
+        return best
+
+    for i, pits in enumerate(compositions(seeds)):
+        values[i] = gain(pits, False)
+    return values
+
+
+def build(directory=DEFAULT_DIR, max_seeds=8, verbose=True):
+    """Build (or extend) the database up to max_seeds seeds on the board"""
+    os.makedirs(directory, exist_ok=True)
+    lower = {}
+    for seeds in range(max_seeds + 1):
+        path = db_path(directory, seeds)
+        if os.path.exists(path):
+            lower[seeds] = open_table(path)[1]
+            continue
+        start = time.perf_counter()
+        lower[seeds] = build_table(seeds, lower)
+        write_table(path, seeds, lower[seeds])
+        if verbose:
+            print(f"  {seeds:>2} seeds: {positions(seeds):>10,} positions  "
+                  f"{time.perf_counter() - start:.1f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mancala endgame database')
+    parser.add_argument('command', choices=['build', 'info'])
+    parser.add_argument('--dir', default=DEFAULT_DIR, help='database directory')
+    parser.add_argument('--max-seeds', type=int, default=8, help='largest seed total to build')
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        build(args.dir, args.max_seeds)
+    db = EndgameDB(args.dir)
+    total = 0
+    for seeds in range(db.max_seeds + 1):
+        size = os.path.getsize(db_path(args.dir, seeds))
+        total += size
+        print(f"{db_path(args.dir, seeds)}  {positions(seeds):>10,} positions  {size:>12,} bytes")
+    print(f"Seed totals 0-{db.max_seeds}, {total:,} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+'''mancala_endgame_db.py ends here'''
@@ -0,0 +1,255 @@
+"""
+Monte Carlo Tree Search engine for the core Mancala rules.
+An alternative to mancala_core.alphabeta: UCT or PUCT selection, leaves
+evaluated with batched rollouts through mancala_batch, subtree reuse
+between moves and iteration or time limits.
+
+Extra turns keep the same player to move in the child node. Node values are
+stored from North's point of view and flipped for the player choosing at
+each node, so chains of extra turns need no special casing.
+
+Usage:
+    from mancala_mcts import MCTS
+    engine = MCTS(iterations=2000)
+    move = engine(state, north_to_move)       # or engine.search(...)
+    print(engine.last_stats)
+"""
+import math
+import time
+import random
+from collections import deque
+
+import numpy as np
+
+from mancala_core import Mancala, evaluate, resolved_diff
+from mancala_batch import MancalaBatch, POLICIES, playout
+
+
+class Node:
+    """Search tree node; value is the sum of North-perspective results"""
+    __slots__ = ('state', 'north_to_move', 'parent', 'move', 'children',
+                 'untried', 'visits', 'value', 'prior', 'terminal')
+
+    def __init__(self, state, north_to_move, parent=None, move=None, prior=1.0):
+        self.state = state
+        self.north_to_move = north_to_move
+        self.parent = parent
+        self.move = move
+        self.children = {}
+        self.untried = None
+        self.visits = 0
+        self.value = 0.0
+        self.prior = prior
+        self.terminal = state.is_terminal()
+
+    def key(self):
+        return tuple(self.state.a), self.north_to_move
+
+    def q(self, north_perspective):
+        """Mean result for the given player"""
+        if self.visits == 0:
+            return 0.0
+        mean = self.value / self.visits
+        return mean if north_perspective else -mean
+
+
+def outcome(state):
+    """+1 North win, -1 South win, 0 draw"""
+    diff = state.a[Mancala.NORTH_STORE] - state.a[Mancala.SOUTH_STORE]
+    return (diff > 0) - (diff < 0)
+
+
+class MCTS:
+    """
+    UCT/PUCT search with batched rollouts.
+    Each round selects up to leaf_batch leaves (virtual loss keeps them
+    apart), then plays rollouts_per_leaf games from every leaf in one
+    lockstep MancalaBatch playout. Stops after 'iterations' leaves or
+    'time_limit' seconds, whichever comes first.
+    """
+    def __init__(self, iterations=2000, time_limit=None, variant='uct', c=None,
+                 rollout='random', rollouts_per_leaf=8, leaf_batch=16,
+                 prior_temperature=200.0, reuse=True, seed=None):
+        if variant not in ('uct', 'puct'):
+            raise ValueError(f"unknown variant {variant!r}")
+        self.iterations = iterations
+        self.time_limit = time_limit
+        self.variant = variant
+        self.c = c if c is not None else (1.4 if variant == 'uct' else 2.5)
+        self.rollout_policy = POLICIES[rollout]
+        self.rollouts_per_leaf = rollouts_per_leaf
+        self.leaf_batch = leaf_batch
+        self.prior_temperature = prior_temperature
+        self.reuse = reuse
+        self.rng = np.random.default_rng(seed)
+        self.random = random.Random(seed)
+        self.root = None
+        self.last_stats = {}
+        self.total_playouts = 0
+
+    def __call__(self, state, north_to_move):
+        move, _ = self.search(state, north_to_move)
+        return move
+
+    # ---------- tree policy ----------
+
+    def _expand_all(self, node):
+        """PUCT: create every child with a softmax prior over the static evaluation"""
+        moves = node.state.legal_moves(node.north_to_move)
+        children = []
+        for m in moves:
+            s2 = node.state.copy()
+            rep = s2.move(m, None, node.north_to_move)
+            children.append((m, s2, node.north_to_move if rep else not node.north_to_move))
+        sign = 1 if node.north_to_move else -1
+        scores = [sign * evaluate(s2) / self.prior_temperature for _, s2, _ in children]
+        top = max(scores)
+        weights = [math.exp(s - top) for s in scores]
+        total = sum(weights)
+        for (m, s2, nxt), w in zip(children, weights):
+            node.children[m] = Node(s2, nxt, node, m, w / total)
+        node.untried = []
+
+    def _expand_one(self, node):
+        """UCT: add one untried child and return it"""
+        if node.untried is None:
+            node.untried = node.state.legal_moves(node.north_to_move)
+            self.random.shuffle(node.untried)
+        m = node.untried.pop()
+        s2 = node.state.copy()
+        rep = s2.move(m, None, node.north_to_move)
+        child = Node(s2, node.north_to_move if rep else not node.north_to_move, node, m)
+        node.children[m] = child
+        return child
+
+    def _select_child(self, node):
+        log_n = math.log(max(node.visits, 1))
+        sqrt_n = math.sqrt(max(node.visits, 1))
+        best, best_score = None, -math.inf
+        for child in node.children.values():
+            q = child.q(node.north_to_move)
+            if self.variant == 'uct':
+                score = q + self.c * math.sqrt(log_n / child.visits)
+            else:
+                score = q + self.c * child.prior * sqrt_n / (1 + child.visits)
+            if score > best_score:
+                best, best_score = child, score
+        return best
+
+    def _select_leaf(self, root):
+        """Walk down to a new or terminal leaf, applying a virtual loss on the way"""
+        node = root
+        while True:
+            node.visits += 1
+            if node.parent is not None:
+                node.value += -1 if node.parent.north_to_move else 1
+            if node.terminal:
+                return node
+            if self.variant == 'uct':
+                if node.untried is None or node.untried:
+                    child = self._expand_one(node)
+                    child.visits += 1
+                    child.value += -1 if node.north_to_move else 1
+                    return child
+            else:
+                if node.untried is None:
+                    self._expand_all(node)
+                if node.visits == 1 and node is not root:
+                    return node
+            node = self._select_child(node)
+
+    def _backpropagate(self, leaf, value):
+        """Replace the virtual losses on the path with the real result"""
+        node = leaf
+        while node is not None:
+            if node.parent is not None:
+                node.value -= -1 if node.parent.north_to_move else 1
+            node.value += value
+            node = node.parent
+
+    # ---------- rollouts ----------
+
+    def _evaluate_leaves(self, leaves):
+        """
+        North-perspective values for leaves, rollouts batched across all of them.
+        Leaves whose winner is already decided by a store majority need no rollouts.
+        """
+        values = [float(outcome(leaf.state)) if leaf.terminal else None for leaf in leaves]
+        for i, leaf in enumerate(leaves):
+            if values[i] is None and leaf.state.is_decided():
+                diff = resolved_diff(leaf.state)
+                values[i] = float((diff > 0) - (diff < 0))
+        pending = [i for i, v in enumerate(values) if v is None]
+        playouts = 0
+        if pending:
+            k = self.rollouts_per_leaf
+            boards = np.repeat([leaves[i].state.a for i in pending], k, axis=0)
+            sides = np.repeat([leaves[i].north_to_move for i in pending], k)
+            diff, _ = playout(MancalaBatch(boards=boards, north_to_move=sides),
+                              self.rollout_policy, rng=self.rng)
+            means = np.sign(diff).reshape(len(pending), k).mean(axis=1)
+            for i, mean in zip(pending, means):
+                values[i] = float(mean)
+            playouts = len(boards)
+        return values, playouts
+
+    # ---------- driver ----------
+
+    def _find_root(self, state, north_to_move):
+        """Reuse a node of the previous tree reached by the moves played since"""
+        key = (tuple(state.a), north_to_move)
+        if self.reuse and self.root is not None:
+            queue = deque([(self.root, 0)])
+            while queue:
+                node, depth = queue.popleft()
+                if node.key() == key:
+                    node.parent = None
+                    node.move = None
+                    return node
+                if depth < 4:
+                    queue.extend((child, depth + 1) for child in node.children.values())
+        return Node(state.copy(), north_to_move)
+
+    def search(self, state, north_to_move):
+        """Return (best pit, root node); statistics are left in last_stats"""
+        start = time.perf_counter()
+        root = self._find_root(state, north_to_move)
+        self.root = root
+        reused = root.visits
+
+        moves = state.legal_moves(north_to_move)
+        if len(moves) <= 1:
+            self.last_stats = {'iterations': 0, 'playouts': 0, 'elapsed': 0.0,
+                               'playouts_per_sec': 0.0, 'reused_visits': reused}
+            return (moves[0] if moves else -1), root
+
+        iterations = playouts = 0
+        # The first batch always runs, so the root has children to choose from
+        while iterations < max(self.iterations, 1):
+            if (iterations and self.time_limit is not None
+                    and time.perf_counter() - start >= self.time_limit):
+                break
+            batch = max(1, min(self.leaf_batch, self.iterations - iterations))
+            leaves = [self._select_leaf(root) for _ in range(batch)]
+            values, played = self._evaluate_leaves(leaves)
+            for leaf, value in zip(leaves, values):
+                self._backpropagate(leaf, value)
+            iterations += batch
+            playouts += played
+
+        elapsed = time.perf_counter() - start
+        self.total_playouts += playouts
+        best = max(root.children.values(), key=lambda c: c.visits)
+        self.last_stats = {'iterations': iterations, 'playouts': playouts,
+                           'elapsed': elapsed,
+                           'playouts_per_sec': playouts / elapsed if elapsed > 0 else 0.0,
+                           'reused_visits': reused,
+                           'root_value': best.q(north_to_move)}
+        return best.move, root
+
+
+def mcts_move(state, north_to_move, **kwargs):
+    """One-shot search without tree reuse"""
+    return MCTS(reuse=False, **kwargs)(state, north_to_move)
+
+'''mancala_mcts.py ends here'''
@@ -0,0 +1,267 @@
+"""
+Perft benchmark and node-count regression suite for the move generators.
+Counts leaf positions to a fixed depth from a suite of positions and checks
+them against known-good counts, reporting leaf nodes per second for every
+move implementation in the repo.
+
+Depth counts moves (plies): an extra turn is one ply like any other move, the
+same player simply moves again. A terminal position (either side empty) is a
+leaf even before the full depth is reached.
+
+The repo has two rule sets, each with its own known-good counts:
+    core      mancala_core.Mancala.move, mancala_core.PackedState.move,
+              mancala_batch.MancalaBatch.step
+              (sow all 14 slots, South scores in 13, North in 6)
+    frontend  Mancala_Board.player_move in ai_vs_ai_enhanced.py,
+              ai_vs_player_enhanced.py and "player vs player.py"
+              (skip the opponent's store, South scores in 6, North in 13)
+The frontend classes are loaded from source, so pygame is not needed.
+
+--search benchmarks the exact-value searches instead (plain alpha-beta, PVS
+with aspiration windows, MTD(f)) on the same positions: nodes, wall time and a
+check that all of them return the same minimax value.
+
+Usage:
+    python mancala_perft.py                      # full suite, all implementations
+    python mancala_perft.py --impl core batch    # selected implementations
+    python mancala_perft.py --depth 4            # other depth, checked where a count is known
+    python mancala_perft.py --search --depth 10  # search benchmark
+"""
+import os
+import ast
+import sys
+import time
+import argparse
+
+import numpy as np
+
+from mancala_core import (Mancala, PackedState, SearchStats, alphabeta, search_aspiration,
+                          search_mtdf, INF)
+from mancala_batch import MancalaBatch
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (board, north_to_move, depth)
+POSITIONS = {
+    'start':         ([4, 4, 4, 4, 4, 4, 0, 4, 4, 4, 4, 4, 4, 0], False, 7),
+    'midgame':       ([0, 5, 1, 6, 2, 7, 9, 3, 0, 6, 1, 5, 0, 3], True, 8),
+    'heavy_pit':     ([1, 0, 27, 0, 2, 1, 4, 0, 3, 0, 1, 0, 2, 7], False, 8),
+    'near_terminal': ([0, 0, 0, 1, 0, 2, 20, 1, 0, 0, 0, 3, 0, 21], False, 10),
+}
+
+# Known-good leaf counts per rule set, position and depth
+KNOWN_COUNTS = {
+    'core': {
+        'start': {1: 6, 2: 36, 3: 186, 4: 964, 5: 4768, 6: 23816, 7: 117580},
+        'midgame': {1: 4, 2: 22, 3: 97, 4: 471, 5: 2115, 6: 9967, 7: 44628, 8: 202692},
+        'heavy_pit': {1: 4, 2: 15, 3: 65, 4: 291, 5: 1391, 6: 6410, 7: 29975, 8: 132079},
+        'near_terminal': {1: 2, 2: 4, 3: 7, 4: 12, 5: 22, 6: 36, 7: 56, 8: 109, 9: 151, 10: 208},
+    },
+    'frontend': {
+        'start': {1: 6, 2: 35, 3: 185, 4: 942, 5: 4690, 6: 23233, 7: 114430},
+        'midgame': {1: 4, 2: 22, 3: 101, 4: 472, 5: 2208, 6: 10090, 7: 46275, 8: 207812},
+        'heavy_pit': {1: 4, 2: 15, 3: 69, 4: 317, 5: 1550, 6: 7370, 7: 34443, 8: 156770},
+        'near_terminal': {1: 2, 2: 4, 3: 7, 4: 12, 5: 16, 6: 32, 7: 51, 8: 94, 9: 130, 10: 172},
+    },
+}
+
+
+# ==================== IMPLEMENTATIONS ====================
+
+def load_board_class(filename):
+    """Extract Mancala_Board from a frontend script without running the script"""
+    path = os.path.join(HERE, filename)
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    classes = [node for node in tree.body
+               if isinstance(node, ast.ClassDef) and node.name == 'Mancala_Board']
+    namespace = {}
+    exec(compile(ast.Module(body=classes, type_ignores=[]), path, 'exec'), namespace)
+    return namespace['Mancala_Board']
+
+
+def core_perft(board, north_to_move, depth):
+    """Recursive perft over mancala_core.Mancala (copy-make)"""
+    def perft(state, north, d):
+        if d == 0 or state.is_terminal():
+            return 1
+        total = 0
+        for m in state.legal_moves(north):
+            child = state.copy()
+            repeat = child.move(m, None, north)
+            total += perft(child, north if repeat else not north, d - 1)
+        return total
+    return perft(Mancala(board), north_to_move, depth)
+
+
+def packed_perft(board, north_to_move, depth):
+    """Recursive perft over mancala_core.PackedState (immutable states)"""
+    def perft(state, d):
+        if d == 0 or state.is_terminal():
+            return 1
+        return sum(perft(state.move(m)[0], d - 1) for m in state.legal_moves())
+    return perft(PackedState.from_list(board, north_to_move), depth)
+
+
+def board_perft(board_class):
+    """Recursive perft over a frontend Mancala_Board class"""
+    def run(board, north_to_move, depth):
+        def perft(mancala, north, d):
+            if d == 0 or sum(mancala[0:6]) == 0 or sum(mancala[7:13]) == 0:
+                return 1
+            total = 0
+            for m in (range(7, 13) if north else range(0, 6)):
+                if mancala[m] == 0:
+                    continue
+                child = board_class(mancala)
+                repeat = child.player_move(m)
+                total += perft(child.mancala, north if repeat else not north, d - 1)
+            return total
+        return perft(list(board), north_to_move, depth)
+    return run
+
+
+def batch_perft(board, north_to_move, depth):
+    """Level-by-level perft: every position of a ply is expanded in one MancalaBatch step"""
+    boards = np.array([board])
+    sides = np.array([north_to_move])
+    leaves = 0
+    for _ in range(depth):
+        batch = MancalaBatch(boards=boards, north_to_move=sides)
+        done = batch.terminal()
+        leaves += int(done.sum())
+        live = ~done
+        if not live.any():
+            return leaves
+        parents = MancalaBatch(boards=batch.boards[live], north_to_move=batch.north_to_move[live])
+        legal = parents.legal_mask().reshape(-1)
+        children = MancalaBatch(boards=np.repeat(parents.boards, 6, axis=0)[legal],
+                                north_to_move=np.repeat(parents.north_to_move, 6)[legal])
+        children.step(np.tile(np.arange(6), len(parents))[legal])
+        boards, sides = children.boards, children.north_to_move
+    return leaves + len(boards)
+
+
+def implementations():
+    """name -> (rule set, perft function)"""
+    return {
+        'core': ('core', core_perft),
+        'packed': ('core', packed_perft),
+        'batch': ('core', batch_perft),
+        'ai_vs_ai': ('frontend', board_perft(load_board_class('ai_vs_ai_enhanced.py'))),
+        'ai_vs_player': ('frontend', board_perft(load_board_class('ai_vs_player_enhanced.py'))),
+        'pvp': ('frontend', board_perft(load_board_class('player vs player.py'))),
+    }
+
+
+# ==================== SEARCH BENCHMARK ====================
+
+SEARCH_DEPTH = 10
+
+
+def alphabeta_search(state, north_to_move, depth, stats):
+    return alphabeta(state, depth, -INF, INF, north_to_move, stats)
+
+
+def pvs_search(state, north_to_move, depth, stats):
+    return search_aspiration(state, depth, north_to_move, stats=stats)
+
+
+def mtdf_search(state, north_to_move, depth, stats):
+    return search_mtdf(state, depth, north_to_move, stats=stats)
+
+
+SEARCHES = {'alphabeta': alphabeta_search, 'pvs': pvs_search, 'mtdf': mtdf_search}
+
+
+def run_search_suite(names=None, depth=None, positions=None):
+    """
+    Search every position with each engine to the same depth (fresh table each).
+    Returns rows of (engine, position, depth, value, nodes, seconds).
+    """
+    rows = []
+    for pos_name in positions or list(POSITIONS):
+        board, north, _ = POSITIONS[pos_name]
+        d = depth if depth is not None else SEARCH_DEPTH
+        for name in names or list(SEARCHES):
+            stats = SearchStats()
+            start = time.perf_counter()
+            value, _ = SEARCHES[name](Mancala(board), north, d, stats)
+            rows.append((name, pos_name, d, value, stats.nodes, time.perf_counter() - start))
+    return rows
+
+
+def print_search_suite(rows):
+    """Print run_search_suite rows; returns the number of positions where the values disagree"""
+    print(f"{'search':<14}{'position':<15}{'depth':>5}{'value':>8}{'nodes':>12}{'time s':>9}{'nodes/s':>12}")
+    values = {}
+    for name, pos_name, d, value, nodes, elapsed in rows:
+        values.setdefault(pos_name, set()).add(value)
+        nps = nodes / elapsed if elapsed > 0 else 0
+        print(f"{name:<14}{pos_name:<15}{d:>5}{value:>8}{nodes:>12}{elapsed:>9.3f}{nps:>12,.0f}")
+    mismatches = [pos_name for pos_name, seen in values.items() if len(seen) > 1]
+    for pos_name in mismatches:
+        print(f"VALUE MISMATCH on {pos_name}: {sorted(values[pos_name])}")
+    return len(mismatches)
+
+
+# ==================== RUNNER ====================
+
+def run_suite(names=None, depth=None, positions=None):
+    """
+    Run perft for the selected implementations and positions.
+    Returns rows of (impl, position, depth, nodes, seconds, expected).
+    """
+    impls = implementations()
+    rows = []
+    for name in names or list(impls):
+        rules, perft = impls[name]
+        for pos_name in positions or list(POSITIONS):
+            board, north, default_depth = POSITIONS[pos_name]
+            d = depth if depth is not None else default_depth
+            start = time.perf_counter()
+            nodes = perft(board, north, d)
+            elapsed = time.perf_counter() - start
+            expected = KNOWN_COUNTS[rules].get(pos_name, {}).get(d)
+            rows.append((name, pos_name, d, nodes, elapsed, expected))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Mancala perft benchmark')
+    parser.add_argument('--impl', nargs='+', choices=sorted(implementations()),
+                        help='implementations to run (default: all)')
+    parser.add_argument('--position', nargs='+', choices=sorted(POSITIONS),
+                        help='positions to run (default: all)')
+    parser.add_argument('--depth', type=int, default=None,
+                        help='override the per-position depth')
+    parser.add_argument('--search', action='store_true',
+                        help='benchmark alphabeta, pvs and mtdf instead of the move generators')
+    args = parser.parse_args(argv)
+
+    if args.search:
+        return 1 if print_search_suite(run_search_suite(None, args.depth, args.position)) else 0
+
+    rows = run_suite(args.impl, args.depth, args.position)
+    failures = 0
+    print(f"{'impl':<14}{'position':<15}{'depth':>5}{'nodes':>12}{'time s':>9}{'nodes/s':>12}  check")
+    for name, pos_name, d, nodes, elapsed, expected in rows:
+        if expected is None:
+            check = '-'
+        elif nodes == expected:
+            check = 'ok'
+        else:
+            check = f'MISMATCH (expected {expected})'
+            failures += 1
+        nps = nodes / elapsed if elapsed > 0 else 0
+        print(f"{name:<14}{pos_name:<15}{d:>5}{nodes:>12}{elapsed:>9.3f}{nps:>12,.0f}  {check}")
+    if failures:
+        print(f"{failures} node count mismatch(es)")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+'''mancala_perft.py ends here'''
@@ -0,0 +1,211 @@
+"""
+Proof-number search for the core Mancala rules.
+Answers the yes/no question "does this side finish at least 'margin' seeds
+ahead from here" (margin 1 = win, margin 0 = win or draw) with depth-first
+proof-number search (df-pn), much faster than searching for the exact value.
+
+Positions are often decided before the end: the final store difference lies in
+    [2 * own store - seeds, seeds - 2 * opponent store]
+(seeds = all seeds in play), so a store holding more than half the seeds wins
+outright. Every node checks these bounds before searching, so a decided
+position is proven or disproven without expanding it.
+
+Proof and disproof numbers are kept in a table of bounded size. When it is
+full, the half of the entries with the least search work below them is
+dropped (positions that were cheap to evaluate are cheap to find again).
+
+Usage:
+    python mancala_pns.py --board 0 3 0 5 1 2 20 1 4 0 2 3 0 7          # South to win?
+    python mancala_pns.py --board 0 3 0 5 1 2 20 1 4 0 2 3 0 7 --side north --draw
+"""
+import sys
+import time
+import argparse
+from typing import Dict, Optional, Tuple
+
+from mancala_core import Mancala
+
+PN_INF = 1 << 40
+
+
+def store_bounds(a, north) -> Tuple[int, int]:
+    """Range of the final store difference (North's minus South's, or the reverse) from a board"""
+    total = sum(a)
+    own, other = (a[Mancala.NORTH_STORE], a[Mancala.SOUTH_STORE]) if north else \
+                 (a[Mancala.SOUTH_STORE], a[Mancala.NORTH_STORE])
+    return 2 * own - total, total - 2 * other
+
+
+class ProofTable:
+    """
+    Position -> (proof number, disproof number, work), at most max_entries entries.
+    'work' is the number of nodes searched below the entry.
+    """
+    def __init__(self, max_entries: int = 1 << 20):
+        self.max_entries = max_entries
+        self.table: Dict[tuple, Tuple[int, int, int]] = {}
+        self.collections = 0
+
+    def get(self, key):
+        return self.table.get(key)
+
+    def put(self, key, pn: int, dn: int, work: int):
+        if len(self.table) >= self.max_entries and key not in self.table:
+            self.collect()
+        self.table[key] = (pn, dn, work)
+
+    def collect(self):
+        """Drop the half of the entries with the least work"""
+        works = sorted(entry[2] for entry in self.table.values())
+        cut = works[len(works) // 2]
+        self.table = {key: entry for key, entry in self.table.items() if entry[2] > cut}
+        self.collections += 1
+
+    def clear(self):
+        self.table.clear()
+
+    def __len__(self):
+        return len(self.table)
+
+
+class NodeLimit(Exception):
+    """Raised inside a proof when its node budget is spent"""
+
+
+class ProofNumberSearch:
+    """
+    df-pn prover. prove() answers True (proven), False (disproven) or None (node
+    budget spent). The table is kept between calls, so proving the positions that
+    follow a proof is almost free.
+    """
+    def __init__(self, max_entries: int = 1 << 20):
+        self.table = ProofTable(max_entries)
+        self.nodes = 0
+        self.max_nodes = None
+        self.attacker = False
+        self.margin = 1
+        sys.setrecursionlimit(max(sys.getrecursionlimit(), 10000))
+
+    def _key(self, state, north_to_move):
+        return bytes(state.a), north_to_move, self.attacker, self.margin
+
+    def _lookup(self, state, north_to_move) -> Tuple[int, int]:
+        lower, upper = store_bounds(state.a, self.attacker)
+        if lower >= self.margin:
+            return 0, PN_INF
+        if upper < self.margin:
+            return PN_INF, 0
+        entry = self.table.get(self._key(state, north_to_move))
+        if entry is None:
+            return 1, 1
+        return entry[0], entry[1]
+
+    def _mid(self, state, north_to_move, th_pn, th_dn):
+        """Search until the position's proof or disproof number reaches its threshold"""
+        self.nodes += 1
+        if self.max_nodes is not None and self.nodes > self.max_nodes:
+            raise NodeLimit()
+        start = self.nodes
+        or_node = north_to_move == self.attacker
+        children = []
+        for m in state.legal_moves(north_to_move):
+            child = state.copy()
+            repeat = child.move(m, None, north_to_move)
+            children.append((child, north_to_move if repeat else not north_to_move))
+
+        while True:
+            numbers = [self._lookup(child, side) for child, side in children]
+            pns = [n[0] for n in numbers]
+            dns = [n[1] for n in numbers]
+            if or_node:
+                pn, dn = min(pns), min(sum(dns), PN_INF)
+            else:
+                pn, dn = min(sum(pns), PN_INF), min(dns)
+            if pn >= th_pn or dn >= th_dn:
+                break
+            if or_node:
+                best = pns.index(pn)
+                second = min(pns[:best] + pns[best + 1:], default=PN_INF)
+                child_th_pn = min(th_pn, second + 1)
+                child_th_dn = min(PN_INF, th_dn - dn + dns[best])
+            else:
+                best = dns.index(dn)
+                second = min(dns[:best] + dns[best + 1:], default=PN_INF)
+                child_th_dn = min(th_dn, second + 1)
+                child_th_pn = min(PN_INF, th_pn - pn + pns[best])
+            self._mid(children[best][0], children[best][1], child_th_pn, child_th_dn)
+
+        self.table.put(self._key(state, north_to_move), pn, dn, self.nodes - start)
+
+    def prove(self, state: Mancala, north_to_move: bool, attacker_north: bool, margin: int = 1,
+              max_nodes: Optional[int] = None) -> Optional[bool]:
+        """
+        Whether attacker_north's side finishes at least 'margin' seeds ahead under
+        best play, or None if max_nodes nodes were not enough to tell.
+        """
+        self.attacker, self.margin = attacker_north, margin
+        state = state.copy()
+        state.finalize_if_terminal()
+        pn, dn = self._lookup(state, north_to_move)
+        if pn and dn:
+            self.max_nodes = None if max_nodes is None else self.nodes + max_nodes
+            try:
+                self._mid(state, north_to_move, PN_INF, PN_INF)
+            except NodeLimit:
+                return None
+            finally:
+                self.max_nodes = None
+            pn, dn = self._lookup(state, north_to_move)
+        if pn == 0:
+            return True
+        if dn == 0:
+            return False
+        return None
+
+    def winning_move(self, state: Mancala, north_to_move: bool, margin: int = 1,
+                     max_nodes: Optional[int] = None) -> Optional[int]:
+        """A move keeping a proven result for the side to move, or None if none is proven"""
+        if not self.prove(state, north_to_move, north_to_move, margin, max_nodes):
+            return None
+        for m in state.legal_moves(north_to_move):
+            child = state.copy()
+            repeat = child.move(m, None, north_to_move)
+            side = north_to_move if repeat else not north_to_move
+            if self._lookup(child, side)[0] == 0:
+                return m
+        # The proof of a child was dropped from the table; prove the children again
+        for m in state.legal_moves(north_to_move):
+            child = state.copy()
+            repeat = child.move(m, None, north_to_move)
+            if self.prove(child, north_to_move if repeat else not north_to_move, north_to_move, margin):
+                return m
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Proof-number search for core Mancala positions')
+    parser.add_argument('--board', type=int, nargs=14, required=True, help='14-slot board')
+    parser.add_argument('--north', action='store_true', help='North to move (default South)')
+    parser.add_argument('--side', choices=('north', 'south'), default=None,
+                        help='side to prove a result for (default: the side to move)')
+    parser.add_argument('--draw', action='store_true', help='prove a win or draw instead of a win')
+    parser.add_argument('--entries', type=int, default=1 << 20, help='table size limit')
+    parser.add_argument('--max-nodes', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    attacker = args.north if args.side is None else args.side == 'north'
+    pns = ProofNumberSearch(args.entries)
+    start = time.perf_counter()
+    result = pns.prove(Mancala(args.board), args.north, attacker, 0 if args.draw else 1, args.max_nodes)
+    goal = 'win or draw' if args.draw else 'win'
+    verdict = {True: 'proven', False: 'disproven', None: 'unknown (node limit)'}[result]
+    print(f"{'North' if attacker else 'South'} {goal}: {verdict}")
+    print(f"{pns.nodes:,} nodes in {time.perf_counter() - start:.2f}s, table {len(pns.table):,} entries, "
+          f"{pns.table.collections} collections")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+'''mancala_pns.py ends here'''
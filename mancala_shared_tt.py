@@ -0,0 +1,167 @@
+"""
+Transposition table in shared memory for searches running in several processes.
+A drop-in for mancala_core.TranspositionTable (get/store/clear/len with the same
+entries), backed by a fixed-size multiprocessing.shared_memory block that every
+worker attaches to by name, so positions searched in one game are reused by the
+games running in the other processes.
+
+Each slot is two 64-bit words: the packed entry and the position hash XORed
+with it. The hash is mancala_solver.position_key of the 14-slot key, which
+unlike hash() is the same in every interpreter, so snapshots stay valid. Writes
+take no lock; a reader recomputes the hash from both words, so a slot torn by
+two processes writing at once, or holding another position, simply misses
+(lockless hashing).
+
+Packed entry bits:
+    0-31   score (signed)
+    32-39  depth
+    40-41  flag (EXACT/LOWER/UPPER)
+    42-45  best move + 1 (0 = none)
+    47     valid
+
+Usage:
+    tt = SharedTranspositionTable(1 << 20)             # owner
+    worker_tt = SharedTranspositionTable(name=tt.name)  # in a worker process
+    ...
+    worker_tt.close(); tt.close(); tt.unlink()
+
+save()/load() snapshot the occupied slots with the mancala_core snapshot header,
+so a table can be carried over to the next run, whatever its size.
+"""
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from mancala_core import SNAPSHOT_SLOTS, write_snapshot_header, read_snapshot_header
+from mancala_solver import position_key
+
+VALID = 1 << 47
+
+
+def pack_entry(depth, value, flag, best_move):
+    return ((value & 0xFFFFFFFF) | (depth & 0xFF) << 32 | flag << 40
+            | ((best_move + 1) & 0xF) << 42 | VALID)
+
+
+def unpack_entry(data):
+    value = data & 0xFFFFFFFF
+    if value >= 1 << 31:
+        value -= 1 << 32
+    return (data >> 32) & 0xFF, value, (data >> 40) & 0x3, ((data >> 42) & 0xF) - 1
+
+
+class SharedTranspositionTable:
+    """
+    Fixed-size, direct-mapped table in shared memory. Pass 'name' to attach to a
+    table created by another process; otherwise a new block with 'entries' slots
+    is created (the creator should unlink it when done).
+    A slot holding the same position at a greater depth is kept, anything else
+    is replaced. probes/hits/stores count this process's use only.
+    """
+    def __init__(self, entries=1 << 20, name=None):
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=entries * 16)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.entries = self.shm.size // 16
+        self.words = np.ndarray((self.entries, 2), dtype=np.uint64, buffer=self.shm.buf)
+        if self.owner:
+            self.words.fill(0)
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def _slot(self, key):
+        h = position_key(key, False)
+        return h, h % self.entries
+
+    def _read(self, h, slot):
+        check, data = int(self.words[slot, 0]), int(self.words[slot, 1])
+        if data and check ^ data == h:
+            return data
+        return None
+
+    def get(self, key):
+        """(depth, value, flag, best move) for a TranspositionTable.key, or None"""
+        self.probes += 1
+        h, slot = self._slot(key)
+        data = self._read(h, slot)
+        if data is None:
+            return None
+        self.hits += 1
+        return unpack_entry(data)
+
+    def store(self, key, depth, value, flag, best_move):
+        h, slot = self._slot(key)
+        old = self._read(h, slot)
+        if old is not None and (old >> 32) & 0xFF > depth:
+            return   # keep the deeper result
+        data = pack_entry(depth, value, flag, best_move)
+        self.words[slot, 1] = data
+        self.words[slot, 0] = h ^ data
+        self.stores += 1
+
+    def clear(self):
+        self.words.fill(0)
+
+    def __len__(self):
+        return int(np.count_nonzero(self.words[:, 1]))
+
+    def hit_rate(self):
+        return self.hits / self.probes if self.probes else 0.0
+
+    def counters(self):
+        return {'probes': self.probes, 'hits': self.hits, 'stores': self.stores}
+
+    def save(self, path):
+        """Write the occupied slots to a snapshot file; returns seconds taken"""
+        start = time.perf_counter()
+        used = self.words[self.words[:, 1] != 0]
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            write_snapshot_header(f, SNAPSHOT_SLOTS, len(used))
+            f.write(used.astype('<u8').tobytes())
+        os.replace(tmp, path)
+        return time.perf_counter() - start
+
+    def load(self, path):
+        """
+        Fill the table from a snapshot; returns seconds taken. Each entry is put back
+        in its slot for this table's size (the hash is the XOR of its two words), the
+        deeper entry winning when two share a slot. Raises ValueError for stale or
+        truncated snapshots.
+        """
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            count = read_snapshot_header(f, SNAPSHOT_SLOTS)
+            data = np.fromfile(f, dtype='<u8', count=count * 2)
+        if len(data) != count * 2:
+            raise ValueError("truncated snapshot")
+        pairs = data.reshape(count, 2).astype(np.uint64)
+        pairs = pairs[pairs[:, 1] != 0]
+        slots = (pairs[:, 0] ^ pairs[:, 1]) % np.uint64(self.entries)
+        depth = (pairs[:, 1] >> np.uint64(32)) & np.uint64(0xFF)
+        deepest_first = np.argsort(depth, kind='stable')[::-1]
+        _, first = np.unique(slots[deepest_first], return_index=True)
+        keep = deepest_first[first]
+        self.words.fill(0)
+        self.words[slots[keep].astype(np.int64)] = pairs[keep]
+        return time.perf_counter() - start
+
+    def close(self):
+        """Detach this process; the owner must still unlink()"""
+        self.words = None
+        self.shm.close()
+
+    def unlink(self):
+        self.shm.unlink()
+
+'''mancala_shared_tt.py ends here'''
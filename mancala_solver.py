@@ -0,0 +1,286 @@
+"""
+Strong solver for the core Mancala rules.
+Runs MTD(f) (repeated null-window alpha-beta with memory) to the end of the
+game, so positions get their exact value under perfect play.
+
+Stores only ever grow, so the rest of the game depends on the twelve pits and
+the side to move alone. The solver works on the future net gain
+    G(pits, side) = final (North store - South store) - current store difference
+which is in [-seeds on board, +seeds on board]. Only positions with South to
+move are searched and stored: North to move is the mirror image (see
+mancala_core.canonical) with G negated. Bounds on G are kept in a
+disk-backed, memory-mapped table of fixed size (memory does not grow with the
+solve) that survives restarts. Progress is checkpointed periodically, and
+low-seed positions can be answered by an endgame table hook.
+
+Usage:
+    python mancala_solver.py                              # solve the 1-seed start (seconds)
+    python mancala_solver.py --seeds 2                    # 2-seed start: long, see --entries
+    python mancala_solver.py --board 0 0 3 0 1 2 9 1 0 2 0 0 4 5 --north
+    python mancala_solver.py --seeds 4 --store kalah.tt   # resumable long solve
+    python mancala_solver.py --seeds 1 --endgame endgame  # use mancala_endgame_db tables
+"""
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+from mancala_core import Mancala, order_moves
+
+STORE_MAGIC = b'MNCLSOLV'
+STORE_VERSION = 1
+HEADER_SIZE = 64
+ENTRY_DTYPE = np.dtype([('key', '<u8'), ('lower', '<i2'), ('upper', '<i2')])
+UNKNOWN_LOWER = -32768
+UNKNOWN_UPPER = 32767
+MASK64 = (1 << 64) - 1
+
+
+def position_key(pits, north_to_move):
+    """64-bit fingerprint of the twelve pits and the side to move (never 0)"""
+    packed = int(north_to_move)
+    for seeds in pits:
+        packed = (packed << 7) | seeds
+    # Fold the 85-bit packing to 64 bits (the odd multiplier keeps positions that
+    # differ only above bit 64 apart), then the splitmix64 finalizer
+    x = (packed + (packed >> 64) * 0x9E3779B97F4A7C15) & MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASK64
+    x ^= x >> 31
+    return x or 1
+
+
+def board_pits(a):
+    """The twelve pits of a 14-slot board, stores left out"""
+    return tuple(a[0:6]) + tuple(a[7:13])
+
+
+class SolverStore:
+    """
+    Fixed-size memory-mapped table of (fingerprint, lower, upper) bounds on G.
+    Lookups are direct-mapped by fingerprint; a slot is overwritten by a new
+    position unless it holds an exact value and the new entry is only a bound.
+    """
+    def __init__(self, path, entries=1 << 20):
+        self.path = path
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                header = f.read(HEADER_SIZE)
+            if header[:8] != STORE_MAGIC:
+                raise ValueError(f"{path} is not a solver store")
+            version, stored_entries = np.frombuffer(header[8:16], dtype='<u4')
+            if version != STORE_VERSION:
+                raise ValueError(f"{path} has store version {version}, expected {STORE_VERSION}")
+            entries = int(stored_entries)
+            self.table = np.memmap(path, dtype=ENTRY_DTYPE, mode='r+',
+                                   offset=HEADER_SIZE, shape=(entries,))
+        else:
+            with open(path, 'wb') as f:
+                header = STORE_MAGIC + np.array([STORE_VERSION, entries], dtype='<u4').tobytes()
+                f.write(header.ljust(HEADER_SIZE, b'\0'))
+            self.table = np.memmap(path, dtype=ENTRY_DTYPE, mode='r+',
+                                   offset=HEADER_SIZE, shape=(entries,))
+            self.table['lower'] = UNKNOWN_LOWER
+            self.table['upper'] = UNKNOWN_UPPER
+        self.entries = entries
+        self.probes = 0
+        self.hits = 0
+
+    def get(self, key):
+        """(lower, upper) bounds on G for a fingerprint, or None"""
+        self.probes += 1
+        entry = self.table[key % self.entries]
+        if int(entry['key']) != key:
+            return None
+        self.hits += 1
+        return int(entry['lower']), int(entry['upper'])
+
+    def put(self, key, lower, upper):
+        slot = key % self.entries
+        entry = self.table[slot]
+        if int(entry['key']) == key:
+            lower = max(lower, int(entry['lower']))
+            upper = min(upper, int(entry['upper']))
+        elif int(entry['key']) != 0 and entry['lower'] == entry['upper'] and lower != upper:
+            return
+        self.table[slot] = (key, lower, upper)
+
+    def probe(self, state, north_to_move):
+        """Exact final store difference (North - South) of a position, or None"""
+        pits = board_pits(state.a)
+        if north_to_move:
+            pits = pits[6:12] + pits[0:6]
+        bounds = self.get(position_key(pits, False))
+        if bounds is None or bounds[0] != bounds[1]:
+            return None
+        gain = -bounds[0] if north_to_move else bounds[0]
+        return state.a[Mancala.NORTH_STORE] - state.a[Mancala.SOUTH_STORE] + gain
+
+    def flush(self):
+        self.table.flush()
+
+    def used(self):
+        return int(np.count_nonzero(self.table['key']))
+
+
+class Solver:
+    """
+    MTD(f) over G(pits, side). 'endgame' is an optional callable
+    (pits, north_to_move) -> G or None, consulted for positions with at most
+    'endgame_seeds' seeds on the board.
+    """
+    def __init__(self, store, endgame=None, endgame_seeds=0, checkpoint_path=None,
+                 checkpoint_every=60.0):
+        self.store = store
+        self.endgame = endgame
+        self.endgame_seeds = endgame_seeds
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+        self.nodes = 0
+        self.endgame_hits = 0
+        self.progress = None
+        self._last_checkpoint = time.perf_counter()
+
+    def _gain(self, pits, north_to_move, alpha, beta):
+        """Fail-soft alpha-beta on G with the store as memory"""
+        south, north = sum(pits[0:6]), sum(pits[6:12])
+        if south == 0:
+            return north
+        if north == 0:
+            return -south
+        if north_to_move:
+            return -self._gain(pits[6:12] + pits[0:6], False, -beta, -alpha)
+        self.nodes += 1
+        if self.endgame is not None and south + north <= self.endgame_seeds:
+            value = self.endgame(pits, north_to_move)
+            if value is not None:
+                self.endgame_hits += 1
+                return value
+
+        key = position_key(pits, False)
+        bounds = self.store.get(key)
+        if bounds is not None:
+            lower, upper = bounds
+            if lower >= beta: return lower
+            if upper <= alpha: return upper
+            alpha, beta = max(alpha, lower), min(beta, upper)
+        alpha0, beta0 = alpha, beta
+
+        # South to move: minimize G
+        state = Mancala(pits[0:6] + (0,) + pits[6:12] + (0,))
+        best = UNKNOWN_UPPER
+        for m in order_moves(state, state.legal_moves(False), False):
+            child = state.copy()
+            repeat = child.move(m, None, False)
+            gain = child.a[Mancala.NORTH_STORE] - child.a[Mancala.SOUTH_STORE]
+            value = gain + self._gain(board_pits(child.a), not repeat, alpha - gain, beta - gain)
+            if value < best: best = value
+            if best < beta: beta = best
+            if alpha >= beta:
+                break
+
+        if best <= alpha0:
+            self.store.put(key, UNKNOWN_LOWER, best)
+        elif best >= beta0:
+            self.store.put(key, best, UNKNOWN_UPPER)
+        else:
+            self.store.put(key, best, best)
+        self._maybe_checkpoint()
+        return best
+
+    def _maybe_checkpoint(self, force=False):
+        """Flush the store and write the MTD(f) progress of the running solve"""
+        now = time.perf_counter()
+        if not force and now - self._last_checkpoint < self.checkpoint_every:
+            return
+        self._last_checkpoint = now
+        self.store.flush()
+        if self.checkpoint_path and self.progress is not None:
+            self.progress['nodes'] = self.nodes
+            tmp = self.checkpoint_path + '.tmp'
+            with open(tmp, 'w') as f:
+                json.dump(self.progress, f)
+            os.replace(tmp, self.checkpoint_path)
+
+    def solve(self, state, north_to_move, guess=0, verbose=False):
+        """
+        Exact final store difference (North - South) of a position under perfect play.
+        Resumes from the checkpoint file when it describes the same position.
+        """
+        pits = board_pits(state.a)
+        root = {'pits': list(pits), 'north_to_move': north_to_move}
+        lower, upper = -sum(pits), sum(pits)
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as f:
+                saved = json.load(f)
+            if saved.get('root') == root:
+                lower, upper, guess = saved['lower'], saved['upper'], saved['guess']
+                if verbose: print(f"Resuming: G in [{lower}, {upper}], guess {guess}")
+
+        start = time.perf_counter()
+        g = max(lower, min(upper, guess))
+        self.progress = {'root': root, 'lower': lower, 'upper': upper, 'guess': g}
+        while lower < upper:
+            beta = g + 1 if g == lower else g
+            g = self._gain(pits, north_to_move, beta - 1, beta)
+            if g < beta:
+                upper = g
+            else:
+                lower = g
+            self.progress.update(lower=lower, upper=upper, guess=g)
+            self._maybe_checkpoint(force=True)
+            if verbose:
+                print(f"  G in [{lower}, {upper}]  nodes {self.nodes:,}  "
+                      f"{time.perf_counter() - start:.1f}s")
+        # Record the root as exact, its bounds may come from different passes or be evicted
+        if north_to_move:
+            self.store.put(position_key(pits[6:12] + pits[0:6], False), -lower, -lower)
+        else:
+            self.store.put(position_key(pits, False), lower, lower)
+        return state.a[Mancala.NORTH_STORE] - state.a[Mancala.SOUTH_STORE] + lower
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Strong solver for core Mancala positions')
+    parser.add_argument('--seeds', type=int, default=1,
+                        help='solve the start position with N seeds per pit (default 1; 2 and up take long)')
+    parser.add_argument('--board', type=int, nargs=14, help='14-slot board to solve')
+    parser.add_argument('--north', action='store_true', help='North to move (default South)')
+    parser.add_argument('--store', default=None, help='memory-mapped store file (default: solver_<seeds>.tt)')
+    parser.add_argument('--entries', type=int, default=1 << 22, help='store slots for a new store file')
+    parser.add_argument('--checkpoint-every', type=float, default=60.0, help='seconds between checkpoints')
+    parser.add_argument('--endgame', default=None, help='endgame database directory (mancala_endgame_db.py)')
+    args = parser.parse_args(argv)
+
+    if args.board:
+        state = Mancala(args.board)
+        label = 'board'
+    else:
+        state = Mancala([args.seeds] * 6 + [0] + [args.seeds] * 6 + [0])
+        label = f'start{args.seeds}'
+    path = args.store or f'solver_{label}.tt'
+
+    store = SolverStore(path, args.entries)
+    endgame, endgame_seeds = None, 0
+    if args.endgame:
+        from mancala_endgame_db import EndgameDB
+        db = EndgameDB(args.endgame)
+        endgame, endgame_seeds = db.probe_pits, db.max_seeds
+    solver = Solver(store, endgame, endgame_seeds, checkpoint_path=path + '.json',
+                    checkpoint_every=args.checkpoint_every)
+    start = time.perf_counter()
+    value = solver.solve(state, args.north, verbose=True)
+    elapsed = time.perf_counter() - start
+    print(f"Value (North - South) with {'North' if args.north else 'South'} to move: {value}")
+    print(f"{solver.nodes:,} nodes in {elapsed:.1f}s, store {store.used():,}/{store.entries:,} slots used, "
+          f"{solver.endgame_hits:,} endgame hits")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+'''mancala_solver.py ends here'''
@@ -244,6 +244,8 @@ def game_over_popup(message, p1_score, p2_score):
 
 
 class Mancala_Board:
+    __slots__ = ('mancala',)
+
     def __init__(self, mancala=None):
         if mancala is not None:
             self.mancala = mancala[:]
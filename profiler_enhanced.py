@@ -0,0 +1,204 @@
+"""
+Frame-time Profiler for the Mancala pygame frontends
+Named timing scopes, an on-screen HUD with a frame-time sparkline and
+optional CSV/JSONL dumps of per-frame timings for offline analysis.
+
+Configuration (environment variables):
+    MANCALA_PROFILE=1                 start with the HUD visible
+    MANCALA_PROFILE_DUMP=frames.csv   record per-frame timings (.csv or .jsonl)
+
+Press F3 in any frontend to toggle the HUD.
+"""
+import os
+import json
+import atexit
+import time
+from collections import deque
+
+import pygame
+
+
+class _NullScope:
+    """Shared no-op scope used while the profiler is disabled"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    """Timing scope that adds its elapsed time to the current frame"""
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self.start
+        current = self.profiler.current
+        current[self.name] = current.get(self.name, 0.0) + elapsed
+        return False
+
+
+class FrameProfiler:
+    """
+    Collects per-stage timings for each rendered frame.
+    Scope names use dots for nesting ("pits.glow" is part of "pits");
+    only top-level names are summed into the frame's work time.
+    """
+    def __init__(self, enabled=False, history=120, dump_path=None,
+                 toggle_key=pygame.K_F3):
+        self.visible = enabled
+        self.dump_path = dump_path
+        self.toggle_key = toggle_key
+        self.history = deque(maxlen=history)
+        self.current = {}
+        self.last_frame = {}
+        self.averages = {}
+        self.frame_index = 0
+        self.last_frame_end = None
+        self._scopes = {}
+        self._dump_file = None
+        self._toggle_held = False
+
+    @classmethod
+    def from_env(cls):
+        """Create a profiler configured from MANCALA_PROFILE* variables"""
+        enabled = os.environ.get('MANCALA_PROFILE', '') not in ('', '0')
+        dump_path = os.environ.get('MANCALA_PROFILE_DUMP') or None
+        return cls(enabled=enabled, dump_path=dump_path)
+
+    @property
+    def active(self):
+        """Timings are only collected when they are shown or recorded"""
+        return self.visible or self.dump_path is not None
+
+    def scope(self, name):
+        """Return a context manager timing the named stage"""
+        if not self.active:
+            return _NULL_SCOPE
+        scope = self._scopes.get(name)
+        if scope is None:
+            scope = self._scopes[name] = _Scope(self, name)
+        return scope
+
+    def toggle(self):
+        """Show or hide the HUD"""
+        self.visible = not self.visible
+        self.current = {}
+        self.last_frame_end = None
+
+    def poll_toggle(self):
+        """Edge-triggered toggle, polled once per frame from draw_board"""
+        held = pygame.key.get_pressed()[self.toggle_key]
+        if held and not self._toggle_held:
+            self.toggle()
+        self._toggle_held = held
+
+    def end_frame(self):
+        """Close the current frame and record its timings"""
+        now = time.perf_counter()
+        if not self.active:
+            return
+        frame_ms = (now - self.last_frame_end) * 1000 if self.last_frame_end else 0.0
+        self.last_frame_end = now
+
+        stages = {name: seconds * 1000 for name, seconds in self.current.items()}
+        work_ms = sum(ms for name, ms in stages.items() if '.' not in name)
+        self.current = {}
+        self.last_frame = stages
+        self.history.append((frame_ms, work_ms))
+        self.frame_index += 1
+
+        for name, ms in stages.items():
+            previous = self.averages.get(name, ms)
+            self.averages[name] = previous + (ms - previous) * 0.1
+
+        if self.dump_path:
+            self._dump(frame_ms, work_ms, stages)
+
+    def _dump(self, frame_ms, work_ms, stages):
+        """Append one frame to the dump file (long-format CSV or JSONL)"""
+        is_csv = self.dump_path.endswith('.csv')
+        if self._dump_file is None:
+            self._dump_file = open(self.dump_path, 'w', encoding='utf-8')
+            if is_csv:
+                self._dump_file.write('frame,stage,ms\n')
+
+        if is_csv:
+            rows = [f"{self.frame_index},frame,{frame_ms:.4f}",
+                    f"{self.frame_index},work,{work_ms:.4f}"]
+            rows.extend(f"{self.frame_index},{name},{ms:.4f}" for name, ms in stages.items())
+            self._dump_file.write('\n'.join(rows) + '\n')
+        else:
+            record = {'frame': self.frame_index, 'frame_ms': round(frame_ms, 4),
+                      'work_ms': round(work_ms, 4),
+                      'stages': {name: round(ms, 4) for name, ms in stages.items()}}
+            self._dump_file.write(json.dumps(record) + '\n')
+
+    def close(self):
+        """Flush and close the dump file"""
+        if self._dump_file is not None:
+            self._dump_file.close()
+            self._dump_file = None
+
+    def draw_hud(self, surface, font, pos=None):
+        """Draw per-stage averages and a frame-time sparkline (right edge by default)"""
+        if not self.visible:
+            return
+
+        lines = []
+        if self.history:
+            frame_ms, work_ms = self.history[-1]
+            fps = 1000 / frame_ms if frame_ms > 0 else 0
+            lines.append((f"frame {frame_ms:5.1f} ms  work {work_ms:5.1f} ms  {fps:4.0f} fps",
+                          (255, 255, 0)))
+        for name in sorted(self.averages):
+            depth = name.count('.')
+            label = name.rsplit('.', 1)[-1]
+            color = (255, 255, 255) if depth == 0 else (180, 200, 230)
+            lines.append((f"{'  ' * depth}{label:<{16 - 2 * depth}}{self.averages[name]:6.2f}", color))
+
+        line_height = font.get_linesize()
+        spark_height = 40
+        width = 300
+        height = line_height * len(lines) + spark_height + 20
+
+        hud = pygame.Surface((width, height), pygame.SRCALPHA)
+        hud.fill((0, 0, 0, 170))
+        for row, (text, color) in enumerate(lines):
+            hud.blit(font.render(text, True, color), (8, 6 + row * line_height))
+
+        if len(self.history) > 1:
+            top = height - spark_height - 8
+            peak = max(max(frame for frame, _ in self.history), 1.0)
+            step = (width - 16) / (self.history.maxlen - 1)
+            budget_y = top + spark_height - spark_height * min(16.7 / peak, 1.0)
+            pygame.draw.line(hud, (255, 80, 80), (8, budget_y), (width - 8, budget_y))
+            for index, key in ((0, (0, 255, 200)), (1, (255, 100, 200))):
+                points = [(8 + i * step, top + spark_height - spark_height * sample[index] / peak)
+                          for i, sample in enumerate(self.history)]
+                pygame.draw.lines(hud, key, False, points)
+
+        if pos is None:
+            pos = (surface.get_width() - width - 10, 200)
+        surface.blit(hud, pos)
+
+
+# Shared profiler used by the frontends and the animation system
+profiler = FrameProfiler.from_env()
+atexit.register(profiler.close)
+
+'''profiler_enhanced.py ends here'''
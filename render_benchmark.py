@@ -0,0 +1,256 @@
+"""
+Headless render benchmark for the pygame frontends.
+Drives draw_board (both enhanced variants), AnimationManager bursts, the
+launcher cards and the game over popups under the SDL dummy video driver,
+reports p50/p95/p99 frame times and compares them against a stored baseline.
+
+Usage:
+    python render_benchmark.py                    # run and compare with render_baseline.json
+    python render_benchmark.py --update-baseline  # record a new baseline
+    python render_benchmark.py --frames 200 --threshold 1.5 idle_ai_vs_ai explosion
+"""
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import ai_vs_ai_enhanced
+import ai_vs_player_enhanced
+import launcher_enhanced
+from ui_config_enhanced import Dimensions
+from animations_enhanced import AnimationManager
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'render_baseline.json')
+SCREEN_SIZE = (Dimensions.SCREEN_WIDTH, Dimensions.SCREEN_HEIGHT)
+START_BOARD = [4] * 6 + [0] + [4] * 6 + [0]
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of a list of samples"""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+# ==================== SCENARIOS ====================
+# Each scenario is a setup function returning a per-frame callable.
+
+def scenario_idle_ai_vs_ai():
+    manager = AnimationManager(SCREEN_SIZE)
+
+    def frame(i):
+        manager.update()
+        ai_vs_ai_enhanced.draw_board(START_BOARD, manager, ai1_prob=50, ai2_prob=50,
+                                     move_count=0, phase=i * 0.5)
+    return frame
+
+
+def scenario_idle_ai_vs_player():
+    manager = AnimationManager(SCREEN_SIZE)
+
+    def frame(i):
+        manager.update()
+        ai_vs_player_enhanced.draw_board(START_BOARD, manager, probability=50,
+                                         phase=i * 0.5, move_count=0)
+    return frame
+
+
+def scenario_explosion():
+    manager = AnimationManager(SCREEN_SIZE)
+
+    def frame(i):
+        # Keep a 100-particle explosion alive for the whole run
+        if i % 60 == 0:
+            manager.particles.clear()
+            manager.trigger_shake(intensity=18)
+            manager.emit_particles(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2,
+                                   count=100, explosion=True)
+        manager.update()
+        ai_vs_ai_enhanced.draw_board(START_BOARD, manager, ai1_prob=50, ai2_prob=50,
+                                     move_count=0, phase=i * 0.5)
+    return frame
+
+
+def scenario_hover_sweep():
+    manager = AnimationManager(SCREEN_SIZE)
+    state = {'hover': None}
+
+    def frame(i):
+        hover = (i // 10) % 6
+        if hover != state['hover']:
+            if state['hover'] is not None:
+                manager.set_pit_hover(state['hover'], False)
+            manager.set_pit_hover(hover, True)
+            state['hover'] = hover
+        manager.update()
+        ai_vs_player_enhanced.draw_board(START_BOARD, manager, probability=50,
+                                         hover_pit=hover, suggested_move=2,
+                                         phase=i * 0.5, move_count=0)
+    return frame
+
+
+def scenario_launcher_cards():
+    def frame(i):
+        hover_idx = (i // 15) % (len(launcher_enhanced.CARDS) + 1)
+        for idx, (card_info, rect) in enumerate(zip(launcher_enhanced.CARDS,
+                                                    launcher_enhanced.card_rects)):
+            launcher_enhanced.draw_card(rect, card_info, idx == hover_idx, False, i * 0.5)
+        launcher_enhanced.draw_footer()
+        launcher_enhanced.pygame.display.flip()
+    return frame
+
+
+def scenario_game_over_popup():
+    def frame(i):
+        if i % 2:
+            ai_vs_ai_enhanced.game_over_popup("AI 2 WINS!", 20, 28)
+        else:
+            ai_vs_player_enhanced.game_over_popup("YOU WIN!", 30, 18)
+    return frame
+
+
+def scenario_game_replay():
+    """Replay a deterministic full game, one frame per position"""
+    rng = random.Random(7)
+    board = ai_vs_ai_enhanced.Mancala_Board(None)
+    positions = [(board.mancala[:], None)]
+    south_turn = True
+    while not board.isEnd():
+        pits = range(0, 6) if south_turn else range(7, 13)
+        move = rng.choice([p for p in pits if board.mancala[p] > 0])
+        repeat_turn = board.player_move(move)
+        positions.append((board.mancala[:], move))
+        if not repeat_turn:
+            south_turn = not south_turn
+
+    manager = AnimationManager(SCREEN_SIZE)
+
+    def frame(i):
+        mancala, move = positions[i % len(positions)]
+        if move is not None and i % len(positions) and i % 4 == 0:
+            manager.emit_fountain(SCREEN_SIZE[0] // 2, SCREEN_SIZE[1] // 2, count=35)
+        manager.update()
+        ai_vs_ai_enhanced.draw_board(mancala, manager, highlight_pit=move,
+                                     ai1_prob=50, ai2_prob=50,
+                                     move_count=i % len(positions), phase=i * 0.5)
+    return frame
+
+
+SCENARIOS = {
+    'idle_ai_vs_ai': scenario_idle_ai_vs_ai,
+    'idle_ai_vs_player': scenario_idle_ai_vs_player,
+    'explosion': scenario_explosion,
+    'hover_sweep': scenario_hover_sweep,
+    'launcher_cards': scenario_launcher_cards,
+    'game_over_popup': scenario_game_over_popup,
+    'game_replay': scenario_game_replay,
+}
+
+
+# ==================== RUNNER ====================
+
+def run_scenario(name, frames=60, warmup=5, repeat=3):
+    """
+    Render a scenario and return its frame-time percentiles in ms.
+    The scenario is run 'repeat' times and the run with the lowest p50 is
+    kept, which filters out most scheduler noise on shared machines.
+    """
+    best = None
+    for _ in range(repeat):
+        random.seed(0)
+        frame = SCENARIOS[name]()
+        for i in range(warmup):
+            frame(i)
+
+        samples = []
+        for i in range(warmup, warmup + frames):
+            start = time.perf_counter()
+            frame(i)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        stats = {'p50': round(percentile(samples, 50), 3),
+                 'p95': round(percentile(samples, 95), 3),
+                 'p99': round(percentile(samples, 99), 3),
+                 'frames': frames}
+        if best is None or stats['p50'] < best['p50']:
+            best = stats
+    return best
+
+
+def compare(results, baseline, threshold, metrics=('p50',)):
+    """Return the list of (scenario, metric, base, current) regressions"""
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        for metric in metrics:
+            base = baseline[name][metric]
+            if base > 0 and stats[metric] > base * threshold:
+                regressions.append((name, metric, base, stats[metric]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Headless render benchmark')
+    parser.add_argument('scenarios', nargs='*', help='scenarios to run (default: all)')
+    parser.add_argument('--frames', type=int, default=60, help='measured frames per scenario')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per scenario (best is kept)')
+    parser.add_argument('--threshold', type=float, default=1.3,
+                        help='fail when a gated metric exceeds baseline times this factor')
+    parser.add_argument('--metric', action='append', choices=('p50', 'p95', 'p99'),
+                        help='percentile(s) to gate on (default: p50; tails are noisy)')
+    parser.add_argument('--baseline', default=BASELINE_FILE, help='baseline JSON file')
+    parser.add_argument('--update-baseline', action='store_true',
+                        help='write the results as the new baseline')
+    args = parser.parse_args(argv)
+
+    names = args.scenarios or list(SCENARIOS)
+    unknown = [n for n in names if n not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    results = {}
+    print(f"{'scenario':<20}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name in names:
+        results[name] = run_scenario(name, args.frames, repeat=args.repeat)
+        r = results[name]
+        print(f"{name:<20}{r['p50']:>10.2f}{r['p95']:>10.2f}{r['p99']:>10.2f}")
+
+    if args.update_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.metric or ('p50',))
+    for name, metric, base, current in regressions:
+        print(f"REGRESSION {name} {metric}: {current:.2f} ms vs baseline {base:.2f} ms "
+              f"(> {args.threshold:.2f}x)")
+    if regressions:
+        return 1
+    print(f"OK: no scenario slower than {args.threshold:.2f}x baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
+
+'''render_benchmark.py ends here'''
@@ -180,6 +180,41 @@ class AnimationConfig:
     HOVER_GLOW_INTENSITY = 1.5
 
 
+# ==================== SURFACE CACHE ====================
+
+class SurfaceCache:
+    """
+    Bounded cache of pre-rendered surfaces.
+    Static decorations (panels, glows, card textures) are rendered once per
+    key and blitted afterwards; the oldest entry is evicted when full.
+    """
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.surfaces = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, render):
+        """Return the surface for key, calling render() on a miss"""
+        surf = self.surfaces.get(key)
+        if surf is not None:
+            self.hits += 1
+            return surf
+        self.misses += 1
+        if len(self.surfaces) >= self.max_entries:
+            self.surfaces.pop(next(iter(self.surfaces)))
+        surf = self.surfaces[key] = render()
+        return surf
+
+    def clear(self):
+        self.surfaces.clear()
+
+
+panel_cache = SurfaceCache()
+glow_cache = SurfaceCache(max_entries=96)
+border_cache = SurfaceCache()
+
+
 # ==================== ADVANCED DRAWING FUNCTIONS ====================
 
 def draw_radial_gradient(surface, center, inner_color, outer_color, radius):
@@ -269,48 +304,65 @@ def blend_colors(color1, color2, ratio):
     return (r, g, b, a) if len(color1) > 3 or len(color2) > 3 else (r, g, b)
 
 
-def draw_neon_glow(surface, pos, radius, color, intensity=1.0, layers=5):
-    """Draw a neon glow effect"""
+def render_neon_glow(radius, color, alphas):
+    """Render the concentric glow layers on their own surface"""
     glow_surf = pygame.Surface((radius * 6, radius * 6), pygame.SRCALPHA)
     
-    for i in range(layers):
-        alpha = int((intensity * 255 / (i + 1)) * 0.6)
+    for i, alpha in enumerate(alphas):
         glow_radius = int(radius * (1 + i * 0.5))
         glow_color = (*color[:3], alpha)
         pygame.draw.circle(glow_surf, glow_color, (radius * 3, radius * 3), glow_radius)
     
+    return glow_surf
+
+
+def draw_neon_glow(surface, pos, radius, color, intensity=1.0, layers=5):
+    """Draw a neon glow effect"""
+    # Keyed on the layer alphas so nearby intensities share a texture
+    alphas = tuple(int((intensity * 255 / (i + 1)) * 0.6) for i in range(layers))
+    glow_surf = glow_cache.get((radius, tuple(color[:3]), alphas),
+                               lambda: render_neon_glow(radius, color, alphas))
     surface.blit(glow_surf, (pos[0] - radius * 3, pos[1] - radius * 3))
 
 
-def draw_glassmorphic_panel(surface, rect, bg_color=None, border_color=None, blur_strength=3):
-    """Draw a modern glassmorphic panel"""
-    if bg_color is None:
-        bg_color = Colors.GLASS_WHITE
-    if border_color is None:
-        border_color = Colors.GLASS_BORDER
+def render_glassmorphic_panel(size, bg_color, border_color):
+    """Render a glassmorphic panel texture with its borders baked in"""
+    width, height = size
     
     # Background with blur effect simulation
-    panel_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(panel_surf, bg_color, (0, 0, rect.width, rect.height),
+    panel_surf = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.rect(panel_surf, bg_color, (0, 0, width, height),
                     border_radius=Dimensions.PANEL_BORDER_RADIUS)
     
     # Add noise/texture for glass effect
     for _ in range(100):
-        x = pygame.math.Vector2(rect.width * pygame.math.Vector2(1, 0).rotate(360 * _ / 100))
+        x = pygame.math.Vector2(width * pygame.math.Vector2(1, 0).rotate(360 * _ / 100))
         noise_alpha = 20
         pygame.draw.circle(panel_surf, (255, 255, 255, noise_alpha),
-                         (int(x.x) % rect.width, int(_ * rect.height / 100)), 2)
-    
-    surface.blit(panel_surf, rect.topleft)
+                         (int(x.x) % width, int(_ * height / 100)), 2)
     
+    # Borders land opaque on the display surface, so bake them in opaque
     # Border with gradient
-    pygame.draw.rect(surface, border_color, rect, width=3,
+    pygame.draw.rect(panel_surf, (*border_color[:3], 255), (0, 0, width, height), width=3,
                     border_radius=Dimensions.PANEL_BORDER_RADIUS)
     
     # Inner highlight
-    highlight_rect = rect.inflate(-6, -6)
-    pygame.draw.rect(surface, (255, 255, 255, 60), highlight_rect, width=2,
+    pygame.draw.rect(panel_surf, (255, 255, 255, 255), (3, 3, width - 6, height - 6), width=2,
                     border_radius=Dimensions.PANEL_BORDER_RADIUS - 3)
+    return panel_surf
+
+
+def draw_glassmorphic_panel(surface, rect, bg_color=None, border_color=None, blur_strength=3):
+    """Draw a modern glassmorphic panel"""
+    if bg_color is None:
+        bg_color = Colors.GLASS_WHITE
+    if border_color is None:
+        border_color = Colors.GLASS_BORDER
+    
+    size = (rect.width, rect.height)
+    panel_surf = panel_cache.get((size, tuple(bg_color), tuple(border_color)),
+                                 lambda: render_glassmorphic_panel(size, bg_color, border_color))
+    surface.blit(panel_surf, rect.topleft)
 
 
 def draw_3d_circle(surface, color, center, radius, depth=8):
@@ -327,11 +379,17 @@ def draw_3d_circle(surface, color, center, radius, depth=8):
 def draw_animated_border(surface, rect, color, phase, width=3, border_radius=0):
     """Draw an animated glowing border"""
     alpha = int(128 + 127 * math.sin(phase))
-    border_color = (*color[:3], alpha)
+    size = (rect.width, rect.height)
     
-    border_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(border_surf, border_color, (0, 0, rect.width, rect.height),
-                    width=width, border_radius=border_radius)
+    def render():
+        border_surf = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(border_surf, (*color[:3], 255), (0, 0, rect.width, rect.height),
+                        width=width, border_radius=border_radius)
+        return border_surf
+    
+    # The shape is cached opaque; the pulse is applied as surface alpha
+    border_surf = border_cache.get((size, tuple(color[:3]), width, border_radius), render)
+    border_surf.set_alpha(alpha)
     surface.blit(border_surf, rect.topleft)
 
 
@@ -358,9 +416,13 @@ def draw_text_with_glow(surface, font, text, pos, color, glow_color=None, glow_i
 def draw_progress_bar(surface, rect, progress, color1, color2, border_radius=15):
     """Draw an animated progress bar"""
     # Background
-    bg_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
-    pygame.draw.rect(bg_surf, (50, 50, 80, 180), (0, 0, rect.width, rect.height),
-                    border_radius=border_radius)
+    def render_background():
+        bg_surf = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(bg_surf, (50, 50, 80, 180), (0, 0, rect.width, rect.height),
+                        border_radius=border_radius)
+        return bg_surf
+    
+    bg_surf = panel_cache.get(('progress', rect.size, border_radius), render_background)
     surface.blit(bg_surf, rect.topleft)
     
     # Fill